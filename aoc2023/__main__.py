@@ -0,0 +1,60 @@
+import sys
+from aoc2023.runner import RunOptions, data_filename, run_day
+
+# The common invocations (`-d 9 -p 2 -q` and friends) are handled here
+# without importing click, everything else goes through launcher.cli
+value_flags: dict[str, str] = {
+    "-d": "day", "--day": "day",
+    "-p": "part", "--part": "part",
+    "-n": "example_number", "--example-number": "example_number",
+    "-g": "generated", "--generated": "generated",
+    "-f": "data_file", "--data-file": "data_file",
+    "--data-folder": "data_folder",
+}
+int_flags = {"day", "part", "example_number", "generated"}
+bool_flags: dict[str, str] = {
+    "-x": "example", "--example": "example",
+    "-q": "quiet", "--quiet": "quiet",
+    "--no-cache": "no_cache",
+    "--refresh": "refresh",
+}
+
+def fast_args(argv: list[str]) -> dict[str, str | int | bool] | None:
+    args: dict[str, str | int | bool] = {
+        "data_folder": "./data", "day": 1, "part": 0, "example_number": 0, "generated": 0,
+        "example": False, "quiet": False, "no_cache": False, "refresh": False}
+
+    todo = list(argv)
+    while len(todo) > 0:
+        match todo.pop(0):
+            case flag if flag in bool_flags:
+                args[bool_flags[flag]] = True
+            case flag if flag in value_flags and len(todo) > 0:
+                name, value = value_flags[flag], todo.pop(0)
+                if name in int_flags:
+                    if not value.lstrip("-").isdigit():
+                        return None
+                    args[name] = int(value)
+                else:
+                    args[name] = value
+            case _:
+                return None
+    return args
+
+def main():
+    args = fast_args(sys.argv[1:])
+    if args is None:
+        from aoc2023.launcher import cli
+        cli(prog_name="aoc2023")
+        return
+
+    options = RunOptions(
+        quiet=bool(args["quiet"]),
+        cache="off" if args["no_cache"] else "refresh" if args["refresh"] else "on")
+    filename = data_filename(
+        str(args["data_folder"]), int(args["day"]), args.get("data_file"),  # type: ignore
+        bool(args["example"]), int(args["example_number"]), int(args["generated"]))
+    run_day(filename, int(args["day"]), int(args["part"]), options)
+
+if __name__ == "__main__":
+    main()
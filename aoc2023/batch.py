@@ -0,0 +1,150 @@
+import contextlib
+import io
+import time
+from os import path
+from typing import TYPE_CHECKING, Callable, Iterator
+from aoc2023 import utils
+from aoc2023.runner import DayRun, PartRun, RunOptions, solve_day
+from aoc2023.solver import solver_for
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from aoc2023.isolate import Limits, LimitsConfig
+
+def parse_days(spec: str) -> list[int]:
+    """ "1-13", "4" or "1,3,5-7" """
+    days: set[int] = set()
+    for chunk in spec.split(","):
+        match chunk.strip().partition("-"):
+            case ("", "", ""):
+                continue
+            case (start, "-", end):
+                days.update(range(int(start), int(end) + 1))
+            case (single, _, _):
+                days.add(int(single))
+
+    if not all(1 <= d <= 25 for d in days):
+        raise ValueError(f"Days must be between 1 and 25, got {spec}")
+    return sorted(days)
+
+def implemented_days(days: list[int]) -> list[int]:
+    out: list[int] = []
+    for day in days:
+        try:
+            if solver_for(day) is None:
+                continue
+        except Exception:
+            # broken days are kept so they show up in the table
+            pass
+        out.append(day)
+    return out
+
+def solve_quietly(filename: str, day: int, part: int, options: RunOptions = RunOptions(),
+                  on_part: Callable[[PartRun], None] | None = None) -> DayRun:
+    # nothing is rendered in batches, stray prints are swallowed
+    utils.set_quiet(True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return solve_day(filename, day, part, options, on_part=on_part)
+
+def missing_input(filename: str, day: int, part: int) -> DayRun:
+    return DayRun(day, error=f"{filename} doesn't exist")
+
+def solve_with(filename: str, day: int, part: int, options: RunOptions, limits: "Limits | None") -> DayRun:
+    if limits is None:
+        return solve_quietly(filename, day, part, options)
+    from aoc2023.isolate import solve_isolated
+    return solve_isolated(filename, day, part, options, limits)
+
+def make_pool(jobs: int, limits: "LimitsConfig | None") -> "Executor":
+    # isolated days already run in a child, a thread is enough to wait for it
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    return ProcessPoolExecutor(max_workers=jobs) if limits is None else ThreadPoolExecutor(max_workers=jobs)
+
+def run_batch(data_folder: str, days: list[int], part: int, ex_suffix: str = "", jobs: int = 1,
+              options: RunOptions = RunOptions(), limits: "LimitsConfig | None" = None) -> list[DayRun]:
+    runs = [
+        (f"{data_folder}/day{day}{ex_suffix}.aoc", day, part)
+        for day in implemented_days(days)]
+    # every day gets its own limits
+    day_limits: Callable[[int], "Limits | None"] = lambda day: None if limits is None else limits.for_day(day)
+
+    if jobs <= 1:
+        return [
+            solve_with(*r, options, day_limits(r[1])) if path.exists(r[0]) else missing_input(*r)
+            for r in runs]
+
+    # Every day is independent, so they are spread over the pool and
+    # collected in the planned order to keep the table stable
+    with make_pool(jobs, limits) as pool:
+        futures = [
+            pool.submit(solve_with, *r, options, day_limits(r[1])) if path.exists(r[0]) else None
+            for r in runs]
+        return [
+            f.result() if f is not None else missing_input(*r)
+            for f, r in zip(futures, runs)]
+
+def run_inputs(filenames: list[str], day: int, part: int, jobs: int = 1, options: RunOptions = RunOptions(),
+               limits: "LimitsConfig | None" = None) -> Iterator[tuple[str, DayRun]]:
+    """ One day over many inputs, yielded as they finish """
+    day_limits = None if limits is None else limits.for_day(day)
+    if jobs <= 1:
+        for filename in filenames:
+            yield filename, solve_with(filename, day, part, options, day_limits)
+        return
+
+    from concurrent.futures import as_completed
+    with make_pool(jobs, limits) as pool:
+        futures = {pool.submit(solve_with, filename, day, part, options, day_limits): filename for filename in filenames}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def format_input_run(filename: str, r: DayRun) -> str:
+    size = f"{path.getsize(filename) / 1024:.1f} KiB"
+    if r.error is not None:
+        return f"{filename} ({size}): error: {r.error}"
+    answers = "  ".join(
+        f"part {p.part}: {p.answer if p.error is None else f'error: {p.error}'} ({ms(p.solve)} ms)"
+        for p in r.parts)
+    return f"{filename} ({size}, parse {ms(r.parse)} ms): {answers}"
+
+def format_throughput(filenames: list[str], wall_time: float, jobs: int = 1) -> str:
+    mb = sum(path.getsize(f) for f in filenames) / 1e6
+    workers = "" if jobs <= 1 else f" on {jobs} workers"
+    return (f"--- {len(filenames)} inputs ({mb:.2f} MB){workers} in {wall_time:.3f} s: "
+            f"{len(filenames) / wall_time:.1f} inputs/s, {mb / wall_time:.2f} MB/s ---")
+
+def format_profiles(results: list[DayRun]) -> str:
+    return "\n\n".join([
+        f"--- day {r.day} {name} ---\n{profile}"
+        for r in results
+        for name, profile in r.profiles.items()])
+
+def ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+def format_table(results: list[DayRun], wall_time: float, jobs: int = 1) -> str:
+    header = ["day", "parse ms", "part 1 ms", "part 2 ms", "total ms", "part 1", "part 2"]
+
+    def row(r: DayRun) -> list[str]:
+        parts = {p.part: p for p in r.parts}
+        timing: Callable[[int], str] = lambda n: "" if n not in parts else ms(parts[n].solve) + ("*" if parts[n].cached else "")
+        answer: Callable[[int], str] = lambda n: "" if n not in parts else parts[n].answer if parts[n].error is None else f"error: {parts[n].error}"
+        if r.error is not None:
+            return [f"{r.day}", "", "", "", ms(r.total), f"error: {r.error}", ""]
+        return [f"{r.day}", ms(r.parse) + ("*" if r.model_cached else ""), timing(1), timing(2), ms(r.total), answer(1), answer(2)]
+
+    rows = [row(r) for r in results]
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    fmt: Callable[[list[str]], str] = lambda row: "  ".join(
+        [c.rjust(w) for c, w in zip(row[:5], widths)] + [c.ljust(w) for c, w in zip(row[5:], widths[5:])]).rstrip()
+
+    out = [fmt(header), "  ".join("-" * w for w in widths)]
+    out += [fmt(row) for row in rows]
+    if any(p.cached for r in results for p in r.parts):
+        out.append("(* answer and solve time from the answer cache)")
+    if any(r.model_cached for r in results):
+        out.append("(* parse time is loading the cached model)")
+    workers = "" if jobs <= 1 else f" on {jobs} workers"
+    solving = sum(r.parse + sum(p.solve for p in r.parts) for r in results)
+    out.append(f"--- {len(results)} days{workers}, {solving:.3f} s solving, {wall_time:.3f} s wall time ---")
+    return "\n".join(out)
@@ -0,0 +1,171 @@
+import contextlib
+import hashlib
+import io
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from os import path
+from typing import Any
+from aoc2023 import utils
+from aoc2023.cache import cache_dir
+from aoc2023.solver import solver_for
+
+@dataclass
+class PhaseTiming():
+    day: int
+    # parse (or load), part1 or part2
+    phase: str
+    samples: list[float]
+
+    def min(self) -> float:
+        return min(self.samples)
+
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    def p95(self) -> float:
+        # nearest rank, so with few runs this is the slowest one
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+@dataclass
+class Comparison():
+    timing: PhaseTiming
+    baseline: float | None
+    threshold: float
+
+    def change(self) -> float | None:
+        return None if self.baseline is None else self.timing.median() / self.baseline - 1
+
+    def regressed(self) -> bool:
+        change = self.change()
+        return change is not None and change > self.threshold
+
+def bench_day(filename: str, day: int, part: int, runs: int, warmup: int = 1,
+              cached_models: bool = False) -> list[PhaseTiming]:
+    """
+    Parses and solves `runs` times, every run from a fresh parse so that
+    nothing memoized on the model carries over between runs. With
+    cached_models the model is loaded from aoc2023.models instead, timed
+    as a load phase.
+    """
+    solver = solver_for(day)
+    if solver is None:
+        raise NotImplementedError(f"day{day} has no solver")
+    parts = solver.parts(part)
+
+    def parse_input() -> Any:
+        with solver.open(filename) as file:
+            return solver.parse(file)
+
+    parse, parse_phase = parse_input, "parse"
+    if cached_models:
+        from aoc2023 import models
+        model_path = models.model_file(day, models.model_key(filename, day, solver))
+        # models that can't be stored are parsed every time
+        if models.load(model_path) is not None or models.store(model_path, parse_input()):
+            parse, parse_phase = lambda: models.load(model_path), "load"
+
+    timings = {parse_phase: PhaseTiming(day, parse_phase, [])}
+    timings |= {f"part{p}": PhaseTiming(day, f"part{p}", []) for p in parts}
+
+    utils.set_quiet(True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for n in range(warmup + runs):
+            start = time.perf_counter()
+            model = parse()
+            samples = {parse_phase: time.perf_counter() - start}
+            for p, solve in parts.items():
+                start = time.perf_counter()
+                solve(model)
+                samples[f"part{p}"] = time.perf_counter() - start
+            if n >= warmup:
+                for phase, sample in samples.items():
+                    timings[phase].samples.append(sample)
+    return list(timings.values())
+
+def input_hash(filename: str) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+def git_commit() -> str:
+    """ short hash of HEAD, with -dirty when there are local changes """
+    try:
+        def git(*args: str) -> str:
+            return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+        commit = git("rev-parse", "--short", "HEAD")
+        return commit + ("-dirty" if git("status", "--porcelain", "--untracked-files=no") != "" else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+class BenchHistory():
+    def __init__(self, db_file: str | None = None):
+        self.db_file = db_file or path.join(cache_dir(), "bench.sqlite")
+        os.makedirs(path.dirname(self.db_file), exist_ok=True)
+        self.db = sqlite3.connect(self.db_file, timeout=30)
+        with self.db:
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS timings (
+                    created REAL, git_commit TEXT, python TEXT, input_hash TEXT,
+                    day INTEGER, phase TEXT, runs INTEGER,
+                    min REAL, median REAL, p95 REAL)""")
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS complexity (
+                    created REAL, git_commit TEXT, python TEXT,
+                    kernel TEXT, fitted TEXT, exponent REAL)""")
+
+    def baseline(self, day: int, phase: str, input_hash: str, git_commit: str | None = None) -> float | None:
+        """ median of the latest run on the same input, or of the latest run at git_commit """
+        query = "SELECT median FROM timings WHERE day = ? AND phase = ? AND input_hash = ?"
+        args: tuple[int | str, ...] = (day, phase, input_hash)
+        if git_commit is not None:
+            query += " AND git_commit = ?"
+            args += (git_commit,)
+        row = self.db.execute(query + " ORDER BY created DESC LIMIT 1", args).fetchone()
+        return None if row is None else row[0]
+
+    def add(self, timing: PhaseTiming, git_commit: str, input_hash: str):
+        with self.db:
+            self.db.execute(
+                "INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), git_commit, platform.python_version(), input_hash,
+                 timing.day, timing.phase, len(timing.samples),
+                 timing.min(), timing.median(), timing.p95()))
+
+    def complexity_baseline(self, kernel: str, git_commit: str) -> str | None:
+        """ latest complexity class fitted for kernel at a commit other than git_commit """
+        row = self.db.execute(
+            "SELECT fitted FROM complexity WHERE kernel = ? AND git_commit != ? ORDER BY created DESC LIMIT 1",
+            (kernel, git_commit)).fetchone()
+        return None if row is None else row[0]
+
+    def add_complexity(self, kernel: str, fitted: str, exponent: float, git_commit: str):
+        with self.db:
+            self.db.execute(
+                "INSERT INTO complexity VALUES (?, ?, ?, ?, ?, ?)",
+                (time.time(), git_commit, platform.python_version(), kernel, fitted, exponent))
+
+    def close(self):
+        self.db.close()
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    ms = lambda seconds: f"{seconds * 1000:.3f}"
+    header = ["day", "phase", "runs", "min ms", "median ms", "p95 ms", "baseline ms", "change"]
+
+    def row(c: Comparison) -> list[str]:
+        t = c.timing
+        change = c.change()
+        return [
+            f"{t.day}", t.phase, f"{len(t.samples)}", ms(t.min()), ms(t.median()), ms(t.p95()),
+            "" if c.baseline is None else ms(c.baseline),
+            "" if change is None else f"{100 * change:+.1f}%" + (" REGRESSION" if c.regressed() else "")]
+
+    rows = [header] + [row(c) for c in comparisons]
+    widths = [max(len(r[i]) for r in rows) for i in range(len(header))]
+    out = ["  ".join(c.rjust(w) for c, w in zip(r, widths)).rstrip() for r in rows]
+    out.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(out)
@@ -0,0 +1,219 @@
+import hashlib
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from os import path
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import ast
+
+# the package's own directory, not one when running from the zipapp
+PACKAGE_DIR = path.dirname(path.abspath(__file__))
+
+def cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or path.join(path.expanduser("~"), ".cache")
+    return path.join(base, "aoc2023")
+
+def on_disk() -> bool:
+    return path.isdir(PACKAGE_DIR)
+
+def read_source(source_file: str) -> bytes:
+    if on_disk():
+        with open(path.join(PACKAGE_DIR, source_file), "rb") as f:
+            return f.read()
+    # through importlib.resources so that this also works from the zipapp
+    from importlib import resources
+    return resources.files("aoc2023").joinpath(source_file).read_bytes()
+
+def module_file(name: str) -> str | None:
+    """ aoc2023 module name (without the package) to its source file, relative to the package """
+    base = "/".join(name.split("."))
+    for candidate in [f"{base}.py", f"{base}/__init__.py"]:
+        if on_disk():
+            if path.isfile(path.join(PACKAGE_DIR, candidate)):
+                return candidate
+        else:
+            from importlib import resources
+            if resources.files("aoc2023").joinpath(candidate).is_file():
+                return candidate
+    return None
+
+def source_stat(source_file: str) -> tuple[str, int, int] | None:
+    """ absolute path, mtime in ns and size of a source, None inside the zipapp """
+    if not on_disk():
+        return None
+    source_path = path.join(PACKAGE_DIR, source_file)
+    st = os.stat(source_path)
+    return source_path, st.st_mtime_ns, st.st_size
+
+# source digest to what it imports, the AST walk is only redone for changed sources
+parsed_imports: dict[bytes, set[str]] = {}
+
+def scan_source(source_file: str) -> tuple[bytes, set[str]]:
+    """ digest of a source and the aoc2023 modules it imports """
+    source = read_source(source_file)
+    digest = hashlib.sha256(source).digest()
+    if digest not in parsed_imports:
+        import ast
+        parsed_imports[digest] = find_imports(ast.parse(source, source_file))
+    return digest, parsed_imports[digest]
+
+def local_imports(source_file: str) -> set[str]:
+    return scan_source(source_file)[1]
+
+def find_imports(tree: "ast.AST") -> set[str]:
+    import ast
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        match node:
+            # from .utils import Pos / from . import utils
+            case ast.ImportFrom(module=module, names=aliases, level=level) if level > 0:
+                names |= {module} if module else {a.name for a in aliases}
+            # from aoc2023.utils import quiet / from aoc2023 import unicode_symbols
+            case ast.ImportFrom(module=module, names=aliases) if module is not None and module.split(".")[0] == "aoc2023":
+                rest = module.partition(".")[2]
+                names |= {rest} if rest else {a.name for a in aliases}
+            # import aoc2023.unicode_symbols as u
+            case ast.Import(names=aliases):
+                names |= {a.name.partition(".")[2] for a in aliases if a.name.startswith("aoc2023.")}
+    return names
+
+Scan = Callable[[str], tuple[bytes, set[str]]]
+
+def day_sources(day: int, scan: Scan = scan_source) -> dict[str, bytes]:
+    """ dayN.py and every aoc2023 module it imports, transitively, to their digests """
+    seen: dict[str, bytes] = {}
+    todo = [f"day{day}"]
+    while len(todo) > 0:
+        match module_file(todo.pop()):
+            case None:
+                pass
+            case f if f in seen:
+                pass
+            case f:
+                seen[f], imports = scan(f)
+                todo += list(imports)
+    return dict(sorted(seen.items()))
+
+def source_files(day: int) -> list[str]:
+    return list(day_sources(day))
+
+def input_digest(filename: str) -> bytes:
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+def sources_digest(day: int, scan: Scan = scan_source) -> bytes:
+    h = hashlib.sha256()
+    for source, digest in day_sources(day, scan).items():
+        h.update(source.encode())
+        h.update(digest)
+    return h.digest()
+
+def digests(filename: str, day: int, store: "AnswerCache | None" = None) -> tuple[bytes, bytes]:
+    """ input_digest and sources_digest, worked out once for all keys of a run """
+    return input_digest(filename), sources_digest(day, scan_source if store is None else store.scan_source)
+
+def answer_key(filename: str, day: int, part: int, known: tuple[bytes, bytes] | None = None) -> str:
+    h = hashlib.sha256()
+    h.update(f"day{day}:part{part}\n".encode())
+    for digest in known or digests(filename, day):
+        h.update(digest)
+    return h.hexdigest()
+
+@dataclass
+class CachedAnswer():
+    output: str
+    solve: float
+
+@dataclass
+class CacheStats():
+    entries: int
+    hits: int
+    misses: int
+    size: int
+    location: str
+
+    def pp(self) -> str:
+        lookups = self.hits + self.misses
+        rate = 0 if lookups == 0 else 100 * self.hits / lookups
+        return "\n".join([
+            f"Answer cache at {self.location}",
+            f"  entries: {self.entries} ({self.size / 1024:.1f} KiB)",
+            f"  hits: {self.hits}, misses: {self.misses} ({rate:.0f}% hit rate)"])
+
+class AnswerCache():
+    def __init__(self, db_file: str | None = None):
+        self.db_file = db_file or path.join(cache_dir(), "answers.sqlite")
+        os.makedirs(path.dirname(self.db_file), exist_ok=True)
+        self.db = sqlite3.connect(self.db_file, timeout=30)
+        # commits don't wait for the disk, a crash may lose the last ones but can't corrupt the db
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        # hits and misses not written yet, they go in with close so that a lookup doesn't write
+        self.counts: dict[str, int] = {}
+        with self.db:
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    key TEXT PRIMARY KEY,
+                    day INTEGER, part INTEGER,
+                    output TEXT, solve REAL, created REAL)""")
+            self.db.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER)")
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS sources (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER, size INTEGER,
+                    digest BLOB, imports TEXT)""")
+
+    def __count(self, name: str):
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def get(self, key: str) -> CachedAnswer | None:
+        row = self.db.execute("SELECT output, solve FROM answers WHERE key = ?", (key,)).fetchone()
+        self.__count("misses" if row is None else "hits")
+        return None if row is None else CachedAnswer(*row)
+
+    def put(self, key: str, day: int, part: int, output: str, solve: float):
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+                (key, day, part, output, solve, time.time()))
+
+    def scan_source(self, source_file: str) -> tuple[bytes, set[str]]:
+        """
+        scan_source, kept by path, mtime and size so that a new process
+        only reads and parses the sources that changed
+        """
+        match source_stat(source_file):
+            case None:
+                return scan_source(source_file)
+            case (source_path, mtime_ns, size):
+                row = self.db.execute(
+                    "SELECT digest, imports FROM sources WHERE path = ? AND mtime_ns = ? AND size = ?",
+                    (source_path, mtime_ns, size)).fetchone()
+                if row is not None:
+                    return row[0], set(row[1].split())
+                digest, imports = scan_source(source_file)
+                with self.db:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                        (source_path, mtime_ns, size, digest, " ".join(sorted(imports))))
+                return digest, imports
+
+    def stats(self) -> CacheStats:
+        counters = dict(self.db.execute("SELECT name, value FROM counters").fetchall())
+        for name, count in self.counts.items():
+            counters[name] = counters.get(name, 0) + count
+        [entries] = self.db.execute("SELECT COUNT(*) FROM answers").fetchone()
+        return CacheStats(
+            entries, counters.get("hits", 0), counters.get("misses", 0),
+            path.getsize(self.db_file), self.db_file)
+
+    def close(self):
+        with self.db:
+            self.db.executemany("""
+                INSERT INTO counters VALUES (?, ?)
+                ON CONFLICT(name) DO UPDATE SET value = value + excluded.value""", self.counts.items())
+        self.counts = {}
+        self.db.close()
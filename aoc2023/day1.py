@@ -1,18 +1,35 @@
 from io import TextIOWrapper
 from typing import List
+from aoc2023.solver import Solver, register
 
 
-def run(file: TextIOWrapper):
-    sum, sum_old = 0, 0
-    for row in file.readlines():
+def parse_rows(file: TextIOWrapper) -> list[str]:
+    return file.readlines()
+
+def part1(rows: list[str]) -> int:
+    return sum(get_first_last_digit(row) for row in rows)
+
+def part2(rows: list[str]) -> int:
+    return sum(replace_str_digits_and_words(row) for row in rows)
+
+def pp_differences(rows: list[str]):
+    sum = 0
+    for row in rows:
         res = replace_str_digits_and_words(row)
         res_old = get_first_last_digit(row)
         sum += res
-        sum_old += res_old
         if res != res_old:
             print(f"[{sum}] {rmnl(row)} -> {res} (old = {res_old})")
 
-    print(f"Sum is {sum} (old= {sum_old})")
+solver = register(1, Solver(
+    parse=parse_rows,
+    part1=part1,
+    part2=part2,
+    render=pp_differences,
+    line_parts={1: lambda row: get_first_last_digit(row), 2: lambda row: replace_str_digits_and_words(row)}))
+
+def run(file: TextIOWrapper):
+    solver.run(file)
 
 def rmnl(s: str) -> str:
     return s.replace("\n", "")
@@ -3,9 +3,10 @@ from enum import Enum
 from io import TextIOWrapper
 from itertools import count
 import itertools
-from typing import Any, Iterator, Literal, Sequence, Type, TypeVar
+from typing import Any, Iterator, Literal, Sequence, Type, TypeAlias, TypeVar
 
-from .utils import Pos
+from .solver import Solver, register
+from .utils import ADJS_DIAG, Pos, adjs_within, quiet, span
 
 class D(Enum):
     up   = 1
@@ -20,6 +21,9 @@ def counterpart(direction: D) -> D:
         case D.left: 	return D.right
         case D.right: 	return D.left
 
+# cells as plain (x, y) tuples, which equal and hash like the Pos of them
+Area: TypeAlias = set[tuple[int, int]]
+
 def pp_d(d: D) -> str:
     return {D.up: "U", D.down: "D", D.left: "L", D.right: "R"}[d]
 """
@@ -58,6 +62,7 @@ class PipeField():
     grid: dict[Pos, Pipe]
     max: Pos
     path: set[Pos] | None = field(default = None)
+    walked: tuple[list[tuple[Pos, D]], Area, Area] | None = field(default = None)
 
     def in_grid(self, p: Pos) -> bool:
         return 0 <= p.x <= self.max.x and 0 <= p.y <= self.max.y
@@ -65,37 +70,50 @@ class PipeField():
     def grid_size(self) -> int:
         return self.max.x * self.max.y
 
-    def get_area(self, from_pos: set[Pos]) -> set[Pos]:
+    @span("flood-fill")
+    def get_area(self, from_pos: set[Pos]) -> Area:
         if self.path is None:
             self.get_path()
             if self.path is None:
                 raise ValueError("Expected path to be set")
 
 
-        visited: set[Pos] = set()
+        visited: set[tuple[int, int]] = set()
 
-        to_visit = list(from_pos)
+        to_visit: list[tuple[int, int]] = [p for p in from_pos if self.in_grid(p)]
 
         while len(to_visit) > 0:
             p = to_visit.pop()
             if p in self.path:
                 pass
-            elif self.in_grid(p):
+            else:
                 visited.add(p)
-                for x in p.adjs_diag():
-                    if self.in_grid(p) and x not in visited:
+                for x in adjs_within(*p, self.max.x, self.max.y, ADJS_DIAG):
+                    if x not in visited:
                         to_visit.append(x)
 
-        # print(visited)
+        # the cells neither flooded nor on the path, row by row instead of a set of the whole grid
+        path = self.path
+        return {cell
+                for y in range(0, self.max.y + 1)
+                for x in range(0, self.max.x + 1)
+                if (cell := (x, y)) not in visited and cell not in path}
 
-        # print(f"self.grid_size()=>{self.grid_size()} - len(visited){len(visited)} - len(self.path){len(self.path)}: {self.grid_size() - len(visited) - len(self.path)}")
-        all = set([Pos(x,y) for x in range(0, self.max.x + 1) for y in range(0, self.max.y + 1)])
 
-        # self.pp(highlight= all.difference(visited, self.path))
-        return(all.difference(visited, self.path))
+    def walk(self) -> tuple[list[tuple[Pos, D]], Area, Area]:
+        """ get_path, but the loop is only walked once per field """
+        if self.walked is None:
+            self.walked = self.get_path()
+        return self.walked
 
+    def enclosed(self) -> Area:
+        _, left_area, right_area = self.walk()
+        # the bottom right corner is past the last column, so never inside the loop
+        outside = Pos(self.max.x, self.max.y)
+        return left_area if outside not in left_area else right_area
 
-    def get_path(self, pp: bool = False) -> tuple[list[tuple[Pos, D]], set[Pos], set[Pos]]:
+    @span("get_path")
+    def get_path(self, pp: bool = False) -> tuple[list[tuple[Pos, D]], Area, Area]:
         current = self.start
         breadcrumbs: list[tuple[Pos, D]] = []
         prev: D | None = None
@@ -113,12 +131,11 @@ class PipeField():
             self.path.add(current)
             current = next
             prev = momentum
-            if pp: self.pp(current)
+            if pp and not quiet(): self.pp(current)
             if self.grid.get(next) == "S":
                 break
 
         self.path = set([p for p, _ in breadcrumbs])
-        self.pp(highlight=left.difference(self.path))
         # self.pp(highlight=self.path.difference(right))
         return breadcrumbs, self.get_area(left.difference(self.path)), self.get_area(right.difference(self.path))
 
@@ -222,7 +239,8 @@ class PipeField():
             case [D.down, D.right]: return " ╔"
             case [D.left, D.right]: return "══"
 
-    def pp(self, current: Pos | None = None, highlight: set[Pos] =set()):
+    @span("pp")
+    def pp(self, current: Pos | None = None, highlight: Area =set()):
         stuff = itertools.cycle("🎄⭐🔔🎄🦌🎁🎄")
         for y in range(0, self.max.y):
             for x in range(0, self.max.x):
@@ -306,15 +324,19 @@ def parse_grid(file) -> PipeField:
 
 
 
-def run(file: TextIOWrapper):
-    f = parse_grid(file)
-
-    bc, left_area, right_area = f.get_path()
-
-
-    print(f"Farthest part on the path: {len(bc) / 2}")
+def pp_areas(f: PipeField):
+    _, left_area, right_area = f.walk()
 
     f.pp(highlight=left_area)
     print(f"Left area: {len(left_area)}")
     f.pp(highlight=right_area)
     print(f"Right area: {len(right_area)}")
+
+solver = register(10, Solver(
+    parse=parse_grid,
+    part1=lambda f: len(f.walk()[0]) // 2,
+    part2=lambda f: len(f.enclosed()),
+    render=pp_areas))
+
+def run(file: TextIOWrapper):
+    solver.run(file)
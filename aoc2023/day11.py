@@ -1,9 +1,10 @@
+from bisect import bisect_left
 from dataclasses import dataclass
 from io import TextIOWrapper
 import itertools
 from typing import Callable, Iterable
+from .solver import Solver, register
 from .utils import Pos
-from .unicode_symbols import FgColor, styled, Style
 
 
 @dataclass
@@ -104,7 +105,7 @@ def parse_grid(file: TextIOWrapper):
 	grid: set[Pos] = set()
 	rows: dict[int, int] = {}
 	columns: dict[int, int] = {}
-	size: Pos = Pos(0, 0)
+	max_x = max_y = 0
 
 	for y, r in enumerate(file.readlines()):
 		if y not in rows:
@@ -112,12 +113,12 @@ def parse_grid(file: TextIOWrapper):
 
 		if r.strip() == "":
 			break
-		size.y = max(y, size.y)
+		max_y = max(y, max_y)
 		for x, ch in enumerate(r.strip()):
 			if x not in columns:
 				columns[x] = 0
 
-			size.x = max(x, size.x)
+			max_x = max(x, max_x)
 
 			match ch:
 				case '#':
@@ -130,7 +131,7 @@ def parse_grid(file: TextIOWrapper):
 					raise ValueError(f"Invalid case {invalid}")
 
 
-	return Grid(size, grid,
+	return Grid(Pos(max_x, max_y), grid,
 			 {k: v == 0 for k,v in columns.items()},
 			 {k: v == 0 for k,v in rows.items()})
 
@@ -144,12 +145,24 @@ def all_distances(grid: set[Pos]) -> int:
 
 	return sum
 
+def axis_distances(coords: list[int]) -> int:
+	""" sum of |a - b| over all pairs, in one pass over the sorted coords """
+	total = 0
+	for i, c in enumerate(sorted(coords)):
+		total += c * (2 * i - len(coords) + 1)
+	return total
 
-def run(file: TextIOWrapper):
-	file.seek(0)
+def sum_distances(grid: Grid, replace_with: int = 2) -> int:
+	""" all_distances of get_expanded_grid, without the pairs """
+	empty_cols = sorted(k for k, v in grid.column_empty.items() if v)
+	empty_rows = sorted(k for k, v in grid.row_empty.items() if v)
+	grow = replace_with - 1
+	return (axis_distances([p.x + grow * bisect_left(empty_cols, p.x) for p in grid.grid])
+		+ axis_distances([p.y + grow * bisect_left(empty_rows, p.y) for p in grid.grid]))
 
-	grid = parse_grid(file)
 
+def pp_space(grid: Grid):
+	from .unicode_symbols import FgColor, styled, Style
 	border_color = FgColor.cyan
 	grid.pp(substitutions={
 		"##": itertools.cycle("🪐🌍⭐🌠🌚🌞👾"),
@@ -171,7 +184,14 @@ def run(file: TextIOWrapper):
 
 	print(f"Grid length: {len(grid.grid)}, with {len(list(itertools.combinations(grid.grid, 2)))} distances")
 	print(f"Taxicab orig: {all_distances(grid.grid)}")
-	print(f"Taxicab expanded: {all_distances(grid.get_expanded_grid())}")
 	print(f"Taxicab expanded by 100: {all_distances(grid.get_expanded_grid(100))}")
-	print(f"Taxicab expanded by 1000000: {all_distances(grid.get_expanded_grid(1000000))}")
+
+solver = register(11, Solver(
+	parse=parse_grid,
+	part1=sum_distances,
+	part2=lambda grid: sum_distances(grid, 1000000),
+	render=pp_space))
+
+def run(file: TextIOWrapper):
+	solver.run(file)
 
@@ -1,18 +1,22 @@
 from io import TextIOWrapper
 import itertools
 from typing import Iterator
+from aoc2023.solver import Solver, register
+from aoc2023.utils import int_rows
 
 
 def parse_pt1(f: TextIOWrapper) -> Iterator[tuple[str, list[int]]]:
-    for l in f.readlines():
-        [puz, runs] = l.strip().split()
-        yield puz, list(map(int, runs.split(",")))
+    text = f.read()
+    for l, runs in zip(text.splitlines(), int_rows(text).rows()):
+        if l.strip() != "":
+            yield l.split(maxsplit=1)[0], runs
 
-def parse_pt2(f: TextIOWrapper) -> Iterator[tuple[str, list[int]]]:
-    for l in f.readlines():
-        [puz, runs] = l.strip().split()
-        yield ('?'.join(itertools.repeat(puz,5)),
-               5*list(map(int, runs.split(","))))
+def parse_row(l: str) -> tuple[str, list[int]]:
+    [puz, runs] = l.strip().split()
+    return puz, list(map(int, runs.split(",")))
+
+def unfold(puz: str, runs: list[int]) -> tuple[str, list[int]]:
+    return ('?'.join(itertools.repeat(puz,5)), 5*runs)
 
 def kf(s: str, rs: list[int], con: bool) -> int:
     return hash((s, ':'.join(map(str, rs)), con))
@@ -55,29 +59,45 @@ def all_sols(p: str, rs: list[int], consuming: bool = False) -> int:
         case invalid:
             raise ValueError(invalid)
 
-def part1(f: TextIOWrapper):
-    s = 0
-    for puzzle, runs in parse_pt1(f):
-        print(f"{puzzle.ljust(25)}: {runs}", end ="")
-        sols = all_sols(puzzle, runs)
-        s += sols
-        print(f" => {sols} solutions!")
-
-    print(f"{s} total solutions!")
-
-def run(f: TextIOWrapper, part: int):
-    if part == 2:
-        part2(f)
-    else:
-        part1(f)
-
-def part2(f: TextIOWrapper):
-    s = 0
-    for puzzle, runs in parse_pt2(f):
-        print(f"{puzzle}: {runs}")
-        sols = all_sols(puzzle, runs)
-        s += sols
-        print(f"\t => {sols} solutions!")
-
-    print(f"{s} total solutions!")
+def count_arrangements(p: str, rs: list[int]) -> int:
+    """ all_sols bottom up, ways[i] counts p[i:] against the runs placed so far """
+    n = len(p)
+    # no '.' in p[i:i+r] when dots[i+r] == dots[i]
+    dots = [0]
+    for ch in p:
+        dots.append(dots[-1] + (ch == '.'))
+
+    # no runs left, only when no '#' remains
+    ways = [0] * (n + 2)
+    for i in reversed(range(n + 1)):
+        ways[i] = 1 if i == n or (p[i] != '#' and ways[i + 1]) else 0
+
+    for r in reversed(rs):
+        after, ways = ways, [0] * (n + 2)
+        for i in reversed(range(n)):
+            if p[i] != '#':
+                ways[i] += ways[i + 1]
+            end = i + r
+            if p[i] != '.' and end <= n and dots[end] == dots[i] and (end == n or p[end] != '#'):
+                ways[i] += after[min(end + 1, n)]
+    return ways[0]
+
+Rows = list[tuple[str, list[int]]]
+
+def part1(rows: Rows) -> int:
+    return sum(count_arrangements(puzzle, runs) for puzzle, runs in rows)
+
+def part2(rows: Rows) -> int:
+    return sum(count_arrangements(*unfold(puzzle, runs)) for puzzle, runs in rows)
+
+solver = register(12, Solver(
+    parse=lambda f: list(parse_pt1(f)),
+    part1=part1,
+    part2=part2,
+    line_parts={
+        1: lambda l: count_arrangements(*parse_row(l)),
+        2: lambda l: count_arrangements(*unfold(*parse_row(l)))}))
+
+def run(f: TextIOWrapper, part: int = 0):
+    solver.run(f, part)
 
@@ -1,9 +1,9 @@
 from dataclasses import dataclass,field
 from enum import Enum
 from io import TextIOWrapper
-from typing import Any, Iterator
-from .unicode_symbols import FgColor, Style, intersperse_at, styled, draw_box, take_n_chars
-from .utils import Pos, filter_empty
+from typing import Any, Iterable, Iterator
+from .solver import Solver, register
+from .utils import Pos, filter_empty, quiet
 
 
 class O(Enum):
@@ -17,6 +17,7 @@ class O(Enum):
 		return self.value.__hash__()
 
 	def __str__(self) -> str:
+		from .unicode_symbols import FgColor, Style, styled
 		match self:
 			case O.Rock: return "🪨 "
 			case O.Ash: return styled("▒▒", Style.dim, FgColor.blue)
@@ -29,12 +30,10 @@ class MirroredGrid():
 	rows: list[str] = field(init=False, default_factory=list)
 
 	def __populate_max(self):
-		for k in self.grid.keys():
-			if self.max_size.x < k.x:
-				self.max_size.x = k.x
-			if self.max_size.y < k.y:
-				self.max_size.y = k.y
-		print(f"max is {self.max_size}")
+		self.max_size = Pos(
+			max((k.x for k in self.grid), default=0),
+			max((k.y for k in self.grid), default=0))
+		if not quiet(): print(f"max is {self.max_size}")
 
 	def __post_init__(self):
 		self.__populate_max()
@@ -48,8 +47,9 @@ class MirroredGrid():
 
 			self.cols.append(positions)
 
-		print("Cols:")
-		[print(f"\t{i}: {c} {hash(c)}") for i, c in enumerate(self.cols)]
+		if not quiet():
+			print("Cols:")
+			[print(f"\t{i}: {c} {hash(c)}") for i, c in enumerate(self.cols)]
 
 		for y in range(0, self.max_size.y+1):
 			positions = ""
@@ -60,12 +60,13 @@ class MirroredGrid():
 
 			self.rows.append(positions)
 
-		print("Rows:")
-		[print(f"\t{i}: {c} {hash(c)}") for i, c in enumerate(self.rows)]
+		if not quiet():
+			print("Rows:")
+			[print(f"\t{i}: {c} {hash(c)}") for i, c in enumerate(self.rows)]
 
 	def score(self) -> int:
 		c, r = self.mirrors()
-		print(f"c, r = {c}, {r}")
+		if not quiet(): print(f"c, r = {c}, {r}")
 		return (c if c is not None else 0) + 100*(r if r is not None else 0)
 
 	def mirrors(self) -> tuple[int | None, int | None]:
@@ -97,6 +98,7 @@ class MirroredGrid():
 
 
 	def __repr__(self) -> str:
+		from .unicode_symbols import draw_box
 		out = ""
 		for y in range(0, self.max_size.y + 1):
 			out += "\n"
@@ -106,15 +108,16 @@ class MirroredGrid():
 		print(f"{col_mirror}, {row_mirror}")
 		return draw_box(out, col_at=filter_empty([col_mirror]), row_at=filter_empty([row_mirror]))
 
-def part1(file: TextIOWrapper) -> Iterator[MirroredGrid]:
+def parse_grids(file: Iterable[str]) -> Iterator[MirroredGrid]:
 	grid: dict[Pos, O] = {}
 
 	y = 0
-	for line in file.readlines():
+	for line in file:
 		match line.strip():
 			case "":
 				y = 0
 				yield MirroredGrid(grid)
+				grid = {}
 
 			case row:
 				for x, ch in enumerate(row):
@@ -125,9 +128,21 @@ def part1(file: TextIOWrapper) -> Iterator[MirroredGrid]:
 
 
 
-def run(file: TextIOWrapper):
-	for grid in part1(file):
+def part1(grids: Iterable[MirroredGrid]) -> int:
+	return sum(grid.score() for grid in grids)
+
+def pp_grids(grids: list[MirroredGrid]):
+	for grid in grids:
 		print(f"\nA new grid has appeared!\n{grid}")
 		print(grid.score())
 
+solver = register(13, Solver(
+	parse=lambda file: list(parse_grids(file)),
+	part1=part1,
+	render=pp_grids,
+	stream=lambda lines: {1: part1(parse_grids(lines))}))
+
+def run(file: TextIOWrapper):
+	solver.run(file)
+
 
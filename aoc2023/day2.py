@@ -3,7 +3,7 @@ from enum import Enum
 from io import TextIOWrapper
 import math
 from typing import List, TypeAlias
-from aoc2023 import unicode_symbols as u
+from aoc2023.solver import Solver, register
 
 
 class Color(Enum):
@@ -23,6 +23,7 @@ def col(input: str) -> Color:
         case bad: raise ValueError(f"{bad} is not a valid color! use red, green or blue")
 
 def col_sym(c: Color) -> str:
+    from aoc2023 import unicode_symbols as u
     match c:
         case Color.red:     return u.red_cube
         case Color.blue:    return u.blue_cube
@@ -60,6 +61,7 @@ class Game():
         return " ".join([f"{v}{col_sym(c)}" for c,v in self.used_cubes().items()])
 
     def print_showings(self) -> str:
+        from aoc2023 import unicode_symbols as u
         return " ║".join(map(
                 lambda s: f"{u.wave} " + " ".join([f"{num}{col_sym(color)}" for color, num in s.items()]),
                 self.showings))
@@ -94,31 +96,47 @@ def parse_game(row: str) -> Game:
 
 
 
-def run(file: TextIOWrapper):
-    games = map(lambda row: parse_game(row), file.readlines())
-    # Sum of the game ids of games that fulfills the requirement
-    sum_gids_possible = 0
-    # Total sum of games power level (product of minimum value of cubes)
-    sum_power_level = 0
-    req: dict[Color, int] = {
-        Color.blue: 14,
-        Color.green: 13,
-        Color.red: 12
-    }
+requirement: dict[Color, int] = {
+    Color.blue: 14,
+    Color.green: 13,
+    Color.red: 12
+}
+
+def parse_games(file: TextIOWrapper) -> List[Game]:
+    return [parse_game(row) for row in file.readlines()]
+
+# Sum of the game ids of games that fulfills the requirement
+def part1(games: List[Game]) -> int:
+    return sum(game.id for game in games if game.fulfills_requirement(requirement))
 
+# Total sum of games power level (product of minimum value of cubes)
+def part2(games: List[Game]) -> int:
+    return sum(game.power_level() for game in games)
+
+def possible_id(row: str) -> int:
+    game = parse_game(row)
+    return game.id if game.fulfills_requirement(requirement) else 0
+
+def pp_games(games: List[Game]):
+    from aoc2023 import unicode_symbols as u
     for game in games:
         print(f"\nGame {game.id}: {game.print_showings()}")
         print(f" {u.text}: \"{game.raw}\"")
         print(f" {u.bolt}: {game.power_level()}")
         print(f" {u.bag}: {game.pretty_used_cubes()}")
 
-        if game.fulfills_requirement(req):
+        if game.fulfills_requirement(requirement):
             print(f" {u.check}: Fulfills requirement!")
-            sum_gids_possible += game.id
         else:
             print(f" {u.fail}: Does not fulfill requirement :(")
+    print()
 
-        sum_power_level += game.power_level()
+solver = register(2, Solver(
+    parse=parse_games,
+    part1=part1,
+    part2=part2,
+    render=pp_games,
+    line_parts={1: possible_id, 2: lambda row: parse_game(row).power_level()}))
 
-    print(f"\nSum of game ids fulfilling requirement: {sum_gids_possible}")
-    print(f"Sum of power level: {sum_power_level}")
\ No newline at end of file
+def run(file: TextIOWrapper):
+    solver.run(file)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from io import TextIOWrapper
 from typing import TypeAlias, List, TypeVar
-from aoc2023 import unicode_symbols as u
+from aoc2023.solver import Solver, register
 
 EngineMatrix: TypeAlias = List[str]
 def ppem(em: EngineMatrix):
@@ -35,14 +35,8 @@ class Symbol():
             [pn1, pn2] = map(lambda pn: pn.number, self.numbers.values())
             return pn1*pn2
 
-def run(file: TextIOWrapper):
-    em = parse_engine_matrix(file)
-
-    symbols = get_all_symbols(em)
-
-    print_symbols(symbols)
-    print_part_nums(symbols)
-    print_gear_ratios(symbols)
+def parse_symbols(file: TextIOWrapper) -> List[Symbol]:
+    return get_all_symbols(parse_engine_matrix(file))
 
 def parse_engine_matrix(file: TextIOWrapper):
     em: EngineMatrix = []
@@ -50,20 +44,20 @@ def parse_engine_matrix(file: TextIOWrapper):
         em.append(line.strip())
     return em
 
-def print_gear_ratios(symbols: list[Symbol]):
-    gear_ratios = sum([
+def sum_gear_ratios(symbols: list[Symbol]) -> int:
+    return sum([
         ratio
         for ratio in map(lambda s: s.gear_ratio(), symbols)
         if ratio is not None])
-    print(f"Gear ratios: {gear_ratios}")
 
-def print_part_nums(symbols: list[Symbol]):
+def sum_part_nums(symbols: list[Symbol]) -> int:
     sum_disc = 0
     for p in get_all_partnums(symbols):
         sum_disc += p.number
-    print(f"Sum of part numbers: {sum_disc}")
+    return sum_disc
 
 def print_symbols(symbols: list[Symbol]):
+    from aoc2023 import unicode_symbols as u
     print(f"{u.presenter} Symbols found!")
     for s in symbols:
         char = f"{u.star}\t" if s.sym == "*" else f"{s.sym}\t"
@@ -184,5 +178,11 @@ def determine_value(em: EngineMatrix, x:int , y: int) -> PartNumber | Symbol | N
         case symbol:
             return Symbol(symbol, (x,y), get_adjacent_partnums(em, (x, y)))
 
+solver = register(3, Solver(
+    parse=parse_symbols,
+    part1=sum_part_nums,
+    part2=sum_gear_ratios,
+    render=print_symbols))
 
-
+def run(file: TextIOWrapper):
+    solver.run(file)
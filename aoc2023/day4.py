@@ -1,8 +1,10 @@
+from collections import deque
 from dataclasses import dataclass
 from io import TextIOWrapper
 import math
-from typing import Callable, List
-from aoc2023 import unicode_symbols as u
+from typing import Callable, Iterable, List
+from aoc2023.solver import Solver, register
+from aoc2023.utils import int_rows
 
 @dataclass
 class Card():
@@ -19,6 +21,7 @@ class Card():
                                if t in winning]
 
     def pp(self) -> str:
+        from aoc2023 import unicode_symbols as u
         pp_l: Callable[[list[int]], str] = lambda l: " ".join(["{0: <3}".format(n) for n in l])
         fixed_score = "{0: <5}".format(self.get_score())
         copies = "{0: <3}".format(self.get_ticket_prize())
@@ -59,13 +62,24 @@ def parse_numbers(number_row: List[str]) -> tuple[List[int], List[int]]:
 
     return (w, l)
 
-def run(file: TextIOWrapper):
-    sum, tickets = 0, 0
-    cards = [parse_card(c) for c in file.readlines()]
+def parse_cards(file: TextIOWrapper) -> List[Card]:
+    text = file.read()
+    if text.strip() == "":
+        return []
+    # every card has as many numbers on its ticket, the card id comes first
+    ticket_size = len(text.split("|", 1)[0].split(":", 1)[1].split())
+    return [
+        Card(id=row[0], ticket=row[1:ticket_size + 1], winning=row[ticket_size + 1:])
+        for row in int_rows(text).rows() if len(row) > 0]
+
+def final_score(cards: List[Card]) -> int:
+    return sum(card.get_score() for card in cards)
+
+def total_tickets(cards: List[Card]) -> int:
+    tickets = 0
     copies: dict[int, int] = {c.id: 1 for c in cards}
 
     for card in cards:
-        sum += card.get_score()
         ticket_prize = card.get_ticket_prize()
         current_ticket_copies = 1 * copies[card.id]
         tickets += current_ticket_copies
@@ -73,7 +87,50 @@ def run(file: TextIOWrapper):
         for id in range(card.id+1, card.id+1+ticket_prize):
             copies[id] += 1 * copies[card.id]
 
+    return tickets
+
+def count_tickets(cards: List[Card]) -> int:
+    """ total_tickets, adding the won copies once per card instead of once per copied card """
+    # won[i] is how many copies start at card i, minus the ones that ended before it
+    won = [0] * (len(cards) + 1)
+    copies = tickets = 0
+    for i, card in enumerate(cards):
+        copies += won[i]
+        tickets += 1 + copies
+        prize = card.get_ticket_prize()
+        if prize > 0:
+            won[i + 1] += 1 + copies
+            won[min(i + 1 + prize, len(cards))] -= 1 + copies
+    return tickets
+
+def stream_cards(rows: Iterable[str]) -> dict[int, int]:
+    """ both parts card by card, only the copies won for the next cards are kept """
+    score = tickets = 0
+    # pending[i] copies of the i-th next card, never longer than the most numbers won
+    pending: deque[int] = deque()
+    for row in rows:
+        if row.strip() == "":
+            continue
+        card = parse_card(row)
+        copies = 1 + (pending.popleft() if len(pending) > 0 else 0)
+        score += card.get_score()
+        tickets += copies
+        prize = card.get_ticket_prize()
+        pending.extend([0] * (prize - len(pending)))
+        for i in range(prize):
+            pending[i] += copies
+    return {1: score, 2: tickets}
+
+def pp_cards(cards: List[Card]):
+    for card in cards:
         print(card.pp())
 
-    print(" ".join([f"{u.checkered_flag} Final score: {sum}",
-                    f"{u.thin_ticket} Total tickets: {tickets}"]))
\ No newline at end of file
+solver = register(4, Solver(
+    parse=parse_cards,
+    part1=final_score,
+    part2=count_tickets,
+    render=pp_cards,
+    stream=stream_cards))
+
+def run(file: TextIOWrapper):
+    solver.run(file)
\ No newline at end of file
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from io import TextIOWrapper
 from typing import Callable
-from aoc2023 import unicode_symbols as u
+from aoc2023.solver import Solver, register
+from aoc2023.utils import int_rows, span
 
 
 def range_union(r1: range, r2: range) -> range | None:
-	print(f"{r1}, {r2}")
 	if r1[0] < r2[-1] and r2[-1] > r1[0]:
 		return range(
 			max(r1[0], 	r2[0]),
@@ -23,7 +23,6 @@ def range_prefix(r1: range, r2: range) -> range | None:
 
 
 def range_suffix(r1: range, r2: range) -> range | None:
-	print("hello?")
 	if r1[-1] > r2[-1]:
 		return range(
 			max(r1[0], r2[-1] + 1),
@@ -76,6 +75,7 @@ class MapTransform():
 		return s
 
 	def symbol(self, object: str) -> str:
+		from aoc2023 import unicode_symbols as u
 		match object:
 			case "seed": 		return u.seed
 			case "soil": 		return u.soil
@@ -96,14 +96,15 @@ class MapTransform():
 
 		return input
 
-	def lookup_range(self, input: range):
-		out += []
+	def lookup_range(self, input: range) -> list[range]:
+		out: list[range] = []
 		for t in self.transforms:
 			match range_union(input, t.source_range()):
 				case None:
 					pass
-				case u:
-
+				case overlap:
+					out.append(offset_range(overlap, t.delta()))
+		return out
 
 	def __largest_number(self) -> int:
 		mx = 0
@@ -143,6 +144,7 @@ class Agriculture():
 	maps: dict[str, MapTransform]
 
 	def pp(self) -> str:
+		from aoc2023 import unicode_symbols as u
 		seeds = ' '.join([f"{n}" for n in self.seeds])
 		out = f"{u.seed}s: {seeds}"
 
@@ -152,17 +154,16 @@ class Agriculture():
 		return out
 
 	def find_lowest_seed(self) -> int:
-		lowest = None
-		for n in self.seeds:
-			for v in self.maps.values():
-				n = v.lookup(n)
-			if lowest == None or n < lowest:
-				lowest = n
-
-		if lowest is None:
+		# map by map, so every map gets one span when tracing
+		values = self.seeds
+		for v in self.maps.values():
+			with span("lookup", map=v.name()):
+				values = [v.lookup(n) for n in values]
+
+		if len(values) == 0:
 			raise ValueError("No seeds found!")
 
-		return lowest
+		return min(values)
 
 	def seed_pairs(self):
 		i = iter(self.seeds)
@@ -173,20 +174,15 @@ def parse_agriculture(input: TextIOWrapper) -> Agriculture:
 	seeds: list[int] | None = None
 	maps: dict[str, MapTransform] = {}
 
-	while input.readable():
-		line = input.readline()
-		match line:
-			case "":
-				break
-			case "\n":
+	text = input.read()
+	for line, values in zip(text.splitlines(), int_rows(text).rows()):
+		match line.strip().split(" "):
+			case [""]:
 				continue
-			case _:
-				pass
 
-		match line.strip().split(" "):
 			# seeds: 1 2 3
-			case ("seeds:", *xs):
-				seeds = [int(s) for s in xs]
+			case ("seeds:", *_):
+				seeds = values
 
 			# source-to-destination map:
 			case (st, "map:"):
@@ -197,9 +193,9 @@ def parse_agriculture(input: TextIOWrapper) -> Agriculture:
 				current_map = MapTransform(source, destination, [])
 
 			# 1 2 3 # destination source span for transforms
-			case (_, _, _) as ss if all([s.isdigit() for s in ss]):
+			case (_, _, _) if len(values) == 3:
 				if current_map is None: raise ValueError("Expected map, got None")
-				[dest, source, span] = [int(s) for s in ss]
+				[dest, source, span] = values
 				t = Transform(dest, source, span)
 				current_map.transforms.append(t)
 
@@ -213,10 +209,13 @@ def parse_agriculture(input: TextIOWrapper) -> Agriculture:
 
 
 
+solver = register(5, Solver(
+	parse=parse_agriculture,
+	part1=Agriculture.find_lowest_seed,
+	render=lambda agr: print(agr.pp())))
+
 def run(file: TextIOWrapper):
-	agr = parse_agriculture(file)
-	print(agr.pp())
-	print(f"Lowest seed is {agr.find_lowest_seed()}")
+	solver.run(file)
 
 def offset_range(r: range, offset: int):
 	return range(r[0] + offset, r[-1] + offset)
\ No newline at end of file
@@ -1,21 +1,21 @@
 from io import TextIOWrapper
 from math import sqrt
+from aoc2023.solver import Solver, register
+from aoc2023.utils import int_rows
 
 def parse_file_part1(file: TextIOWrapper) -> list[tuple[int, int]]:
     times: list[int] | None = None
     distances: list[int] |None = None
 
-    while True:
-        line = file.readline()
+    text = file.read()
+    for line, values in zip(text.splitlines(), int_rows(text).rows()):
         match line.partition(":"):
             case ("", "", _):
-                break
-            case ("\n", _, _):
                 continue
-            case ("Time", ":", values):
-                times = [int(n) for n in values.split()]
-            case ("Distance", ":", values):
-                distances = [int(n) for n in values.split()]
+            case ("Time", ":", _):
+                times = values
+            case ("Distance", ":", _):
+                distances = values
             case (key, sep, rest):
                 raise ValueError(f"Found unhandled case {key}{sep}{rest}")
 
@@ -24,28 +24,11 @@ def parse_file_part1(file: TextIOWrapper) -> list[tuple[int, int]]:
     else:
         return list(zip(times, distances))
 
-def parse_file_part2(file: TextIOWrapper) -> tuple[int, int]:
-    time: int | None = None
-    distance: int |None = None
-
-    while True:
-        line = file.readline()
-        match line.partition(":"):
-            case ("", "", _):
-                break
-            case ("\n", _, _):
-                continue
-            case ("Time", ":", value):
-                time = int("".join(value.split()))
-            case ("Distance", ":", value):
-                distance = int("".join(value.split()))
-            case (key, sep, rest):
-                raise ValueError(f"Found unhandled case {key}{sep}{rest}")
-
-    if time is None or distance is None:
-        raise ValueError("Expected both Time: <ints> and Distance: <ints>!")
-    else:
-        return time, distance
+def join_races(races: list[tuple[int, int]]) -> tuple[int, int]:
+    """ Part 2 reads the numbers on each line as one number, ignoring the spaces """
+    time = int("".join(str(t) for t, _ in races))
+    distance = int("".join(str(d) for _, d in races))
+    return time, distance
 
 def wins_eq(time: int, distance: int) -> int:
     try:
@@ -63,26 +46,31 @@ def wins_eq(time: int, distance: int) -> int:
         case _:
             return 0
 
-def run(file: TextIOWrapper):
-    part1(file)
-    part2(file)
-
-def part2(file: TextIOWrapper):
-    file.seek(0)
-    print("\nPART 2")
-    time, distance = parse_file_part2(file)
-
-    print(f"(Time: {time}, Distance: {distance})")
-    ws = wins_eq(time, distance)
-    print(f"Wins: {ws}")
+def part2(races: list[tuple[int, int]]) -> int:
+    time, distance = join_races(races)
+    return wins_eq(time, distance)
 
-def part1(file: TextIOWrapper):
-    print("PART 1")
+def part1(races: list[tuple[int, int]]) -> int:
     p = 1
-    for time, distance in parse_file_part1(file):
+    for time, distance in races:
         l = wins_eq(time, distance)
         p *= l
 
-    print(f"total result: {p}")
+    return p
+
+def pp_races(races: list[tuple[int, int]]):
+    for time, distance in races:
+        print(f"(Time: {time}, Distance: {distance})")
+    time, distance = join_races(races)
+    print(f"Joined: (Time: {time}, Distance: {distance})")
+
+solver = register(6, Solver(
+    parse=parse_file_part1,
+    part1=part1,
+    part2=part2,
+    render=pp_races))
+
+def run(file: TextIOWrapper):
+    solver.run(file)
 
 
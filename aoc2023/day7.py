@@ -1,10 +1,12 @@
 from abc import ABCMeta, abstractmethod
+from collections import Counter
 from enum import Enum
 import functools
 from io import TextIOWrapper
 from itertools import groupby
 import itertools
 from typing import Any, Callable, Iterator, TypeVar
+from aoc2023.solver import Solver, register
 
 rank: dict[str, int] = {
     "A": 12,
@@ -57,6 +59,10 @@ class HandType(Enum):
 
 def hand_type(hand: str) -> HandType:
     occs = [len(list(group)) for _, group in groupby(sorted(hand))]
+    return occurrences_type(occs)
+
+
+def occurrences_type(occs: list[int]) -> HandType:
     match sorted(occs, reverse=True):
         case [5]:			return HandType.FiveOfAKind
         case [4, *_]:		return HandType.FourOfAKind
@@ -125,6 +131,18 @@ def with_substitutions(hand: str) -> HandType:
     except ValueError:
         raise ValueError(f"failed subbing! {hand} => subs: {subs}")
 
+def joker_type(hand: str) -> HandType:
+    """ with_substitutions without trying them all, the jokers join the most common card """
+    occs = sorted(Counter(c for c in hand if c != "J").values(), reverse=True) or [0]
+    occs[0] += hand.count("J")
+    return occurrences_type(occs)
+
+def hand_key(hand: str, jokers: bool = False) -> tuple[int, list[int]]:
+    """ sorts like cmp_hands, or cmp_hands_2 with jokers """
+    if jokers:
+        return joker_type(hand).value, [rank2[c] for c in hand]
+    return hand_type(hand).value, [rank[c] for c in hand]
+
 def parse_hands(file: TextIOWrapper) -> list[tuple[str, int]]:
     out: list[tuple[str, int]] = []
     while True:
@@ -172,19 +190,27 @@ def cmp_hands_2(h1: str, h2: str) -> int:
                 #     print(f"{h1 if r > 0 else h2} won!")
                 #     return r
 
-def run(file: TextIOWrapper):
+def total_winnings(hands: list[tuple[str, int]], cmp_hands: Callable[[str, str], int]) -> int:
     hand_order = zip(
         sorted(
-            parse_hands(file),
-            key= functools.cmp_to_key(lambda x,y: cmp_hands_2(x[0], y[0]))),
+            hands,
+            key= functools.cmp_to_key(lambda x,y: cmp_hands(x[0], y[0]))),
         range(1, 1000000))
 
     acc: list[tuple[str, int, int]] = []
     for ((hand, bet), rank) in hand_order:
         acc.append((hand, bet, rank))
 
-    s = 0
-    for hand, bet, rank in acc:
-        s += bet * rank
+    return sum([bet * rank for _, bet, rank in acc])
+
+def ranked_winnings(hands: list[tuple[str, int]], jokers: bool = False) -> int:
+    ordered = sorted(hands, key=lambda h: hand_key(h[0], jokers))
+    return sum(bet * rank for rank, (_, bet) in enumerate(ordered, 1))
 
-    print(f"Total winnings: {sum([bet * rank for _, bet, rank in acc])}")
\ No newline at end of file
+solver = register(7, Solver(
+    parse=parse_hands,
+    part1=ranked_winnings,
+    part2=lambda hands: ranked_winnings(hands, jokers=True)))
+
+def run(file: TextIOWrapper):
+    solver.run(file)
\ No newline at end of file
@@ -4,7 +4,7 @@ from io import TextIOWrapper
 import itertools
 import math
 from typing import Callable
-import aoc2023.unicode_symbols as u
+from aoc2023.solver import Solver, register
 
 
 class Direction(Enum):
@@ -118,7 +118,23 @@ def walk_lcm(
 
 
 
-def run(file: TextIOWrapper):
-	route, nodes = parse_day8(file)
+Network = tuple[list[Direction], dict[str, Node]]
+
+def part1(network: Network) -> int:
+	route, nodes = network
+	if "AAA" not in nodes:
+		raise ValueError("Expected a node AAA to start from")
+	return walk(route, "AAA", nodes, "ZZZ")
+
+def part2(network: Network) -> int:
+	route, nodes = network
 	start_nodes: list[str] = [n for n in nodes.keys() if n[-1] == "A"]
-	print(walk_lcm(route, start_nodes, nodes, lambda x: x[-1] == "Z"))
\ No newline at end of file
+	return walk_lcm(route, start_nodes, nodes, lambda x: x[-1] == "Z")
+
+solver = register(8, Solver(
+	parse=parse_day8,
+	part1=part1,
+	part2=part2))
+
+def run(file: TextIOWrapper):
+	solver.run(file)
\ No newline at end of file
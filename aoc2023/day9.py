@@ -1,7 +1,10 @@
-from functools import reduce
+from functools import cache, reduce
 from io import TextIOWrapper
 from itertools import pairwise
+from math import comb
 from typing import Iterator
+from aoc2023.solver import Solver, register
+from aoc2023.utils import MappedInput, int_rows, uses_numpy
 
 def parse_series(file: TextIOWrapper) -> Iterator[list[int]]:
 	file.seek(0)
@@ -11,6 +14,12 @@ def parse_series(file: TextIOWrapper) -> Iterator[list[int]]:
 			break
 		yield [int(i) for i in row.split()]
 
+def parse_series_bytes(mapped: MappedInput) -> list[list[int]]:
+	if uses_numpy(len(mapped)):
+		return list(int_rows(mapped.data).rows())
+	# int() takes the bytes tokens as they are, no decoding to str needed
+	return [[int(i) for i in line.tobytes().split()] for line in mapped.lines()]
+
 
 def steps(l: list[int]) -> list[int]:
 	xs = []
@@ -44,7 +53,31 @@ def get_prev_step(xs: list[int]) -> int:
 	return reduce(lambda sum,x: x - sum, reversed(edge_numbers), 0)
 
 
+@cache
+def next_weights(n: int) -> tuple[int, ...]:
+	# the sum of the edge numbers is a binomial sum over the series itself
+	return tuple((-1) ** (n - 1 - i) * comb(n, i) for i in range(n))
+
+@cache
+def prev_weights(n: int) -> tuple[int, ...]:
+	return tuple((-1) ** i * comb(n, i + 1) for i in range(n))
+
+def next_value(xs: list[int]) -> int:
+	""" get_next_step in one pass, for series that end in zeros """
+	return sum(w * x for w, x in zip(next_weights(len(xs)), xs))
+
+def prev_value(xs: list[int]) -> int:
+	return sum(w * x for w, x in zip(prev_weights(len(xs)), xs))
+
+
+solver = register(9, Solver(
+	parse=parse_series_bytes,
+	part1=lambda series: sum(next_value(ls) for ls in series),
+	part2=lambda series: sum(prev_value(ls) for ls in series),
+	mapped=True,
+	line_parts={
+		1: lambda line: next_value([int(i) for i in line.split()]),
+		2: lambda line: prev_value([int(i) for i in line.split()])}))
+
 def run(file: TextIOWrapper):
-	n = sum([get_next_step(ls) for ls in parse_series(file)])
-	p = sum([get_prev_step(ls) for ls in parse_series(file)])
-	print(f"prev, next= ({p}, {n})")	
\ No newline at end of file
+	solver.run(file)	
\ No newline at end of file
@@ -0,0 +1,24 @@
+import importlib
+import os
+from os import path
+import random
+
+# Every generator produces a valid input at roughly `scale` times the
+# size of a real puzzle input, from a seeded random.Random
+days = list(range(1, 14))
+
+def generate(day: int, scale: int = 1, seed: int = 2023) -> str:
+    if day not in days:
+        raise ValueError(f"No generator for day {day}")
+    module = importlib.import_module(f".day{day}", "aoc2023.gen")
+    return module.generate(random.Random(f"{seed}:{day}:{scale}"), scale)
+
+def generated_filename(data_folder: str, day: int, scale: int) -> str:
+    return path.join(data_folder, f"day{day}gen{scale}.aoc")
+
+def write(data_folder: str, day: int, scale: int = 1, seed: int = 2023) -> str:
+    os.makedirs(data_folder, exist_ok=True)
+    filename = generated_filename(data_folder, day, scale)
+    with open(filename, "w") as f:
+        f.write(generate(day, scale, seed))
+    return filename
@@ -0,0 +1,19 @@
+from os import path
+import click
+from aoc2023 import gen
+
+@click.command()
+@click.option("--data-folder", default="./data", help="Path to data folder")
+@click.option("--days", default="1-13", help="Days to generate inputs for, e.g. 1-13 or 7,12")
+@click.option("-s", "--scale", multiple=True, default=[10, 100, 1000], type=int, help="Size compared to a real input")
+@click.option("--seed", default=2023, help="Random seed")
+def cli(data_folder: str, days: str, scale: list[int], seed: int):
+    """Writes generated inputs as data/day<N>gen<scale>.aoc"""
+    from aoc2023.batch import parse_days
+    for day in [d for d in parse_days(days) if d in gen.days]:
+        for s in scale:
+            filename = gen.write(data_folder, day, s, seed)
+            print(f"day {day} x{s}: {filename} ({path.getsize(filename) / 1024:.0f} KiB)")
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,14 @@
+import random
+
+words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+letters = "abcdefghijklmnopqrstuvwxyz"
+
+def line(rng: random.Random) -> str:
+    parts = [rng.choice([rng.choice(letters), rng.choice(words), str(rng.randint(1, 9))])
+             for _ in range(rng.randint(2, 12))]
+    # part 1 needs at least one digit on every line
+    parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+    return "".join(parts)
+
+def generate(rng: random.Random, scale: int) -> str:
+    return "\n".join(line(rng) for _ in range(1000 * scale)) + "\n"
@@ -0,0 +1,52 @@
+import math
+import random
+
+pipes: dict[frozenset[tuple[int, int]], str] = {
+    frozenset([(0, -1), (0, 1)]): "|",
+    frozenset([(-1, 0), (1, 0)]): "-",
+    frozenset([(0, -1), (1, 0)]): "L",
+    frozenset([(0, -1), (-1, 0)]): "J",
+    frozenset([(0, 1), (-1, 0)]): "7",
+    frozenset([(0, 1), (1, 0)]): "F",
+}
+
+def snake(rng: random.Random, x0: int, y0: int, width: int, height: int) -> list[tuple[int, int]]:
+    """
+    A loop snaking back and forth in arms two rows apart, returning up
+    along the left column. The arms reach random lengths, the rows left
+    open between them alternate between inside and outside of the loop.
+    """
+    arms = (height + 1) // 2
+    arms -= arms % 2
+    loop = [(x0, y0)]
+    for k in range(arms):
+        y = y0 + 2 * k
+        if k % 2 == 0:
+            reach = rng.randint(x0 + width // 2, x0 + width - 1)
+            loop += [(x, y) for x in range(x0 + 1, reach + 1)]
+        else:
+            loop += [(x, y) for x in range(reach, x0, -1)]
+        if k < arms - 1:
+            loop.append((loop[-1][0], y + 1))
+    loop += [(x0, y) for y in range(y0 + 2 * (arms - 1), y0, -1)]
+    return loop
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = int(140 * math.sqrt(scale))
+    grid = [[rng.choice("|-LJ7F..") for _ in range(side)] for _ in range(side)]
+
+    margin = rng.randint(1, 4)
+    loop = snake(rng, margin, margin, side - 2 * margin, side - 2 * margin)
+    for i, (x, y) in enumerate(loop):
+        before, after = loop[i - 1], loop[(i + 1) % len(loop)]
+        grid[y][x] = pipes[frozenset([(before[0] - x, before[1] - y), (after[0] - x, after[1] - y)])]
+
+    sx, sy = rng.choice(loop)
+    grid[sy][sx] = "S"
+    on_loop = set(loop)
+    # only the two loop neighbours may connect to S
+    for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+        if (sx + dx, sy + dy) not in on_loop:
+            grid[sy + dy][sx + dx] = "."
+
+    return "\n".join("".join(row) for row in grid) + "\n"
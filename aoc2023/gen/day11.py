@@ -0,0 +1,12 @@
+import math
+import random
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = int(140 * math.sqrt(scale))
+    empty_rows = set(rng.sample(range(side), side // 20))
+    empty_columns = set(rng.sample(range(side), side // 20))
+    return "\n".join(
+        "".join(
+            "#" if y not in empty_rows and x not in empty_columns and rng.random() < 0.024 else "."
+            for x in range(side))
+        for y in range(side)) + "\n"
@@ -0,0 +1,13 @@
+import itertools
+import random
+
+def line(rng: random.Random) -> str:
+    springs = "".join(rng.choice("#..") for _ in range(rng.randint(4, 20)))
+    if "#" not in springs:
+        springs = "#" + springs[1:]
+    runs = [len(list(g)) for ch, g in itertools.groupby(springs) if ch == "#"]
+    hidden = "".join("?" if rng.random() < 0.5 else ch for ch in springs)
+    return f"{hidden} {','.join(map(str, runs))}"
+
+def generate(rng: random.Random, scale: int) -> str:
+    return "\n".join(line(rng) for _ in range(1000 * scale)) + "\n"
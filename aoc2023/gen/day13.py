@@ -0,0 +1,16 @@
+import random
+
+def pattern(rng: random.Random) -> list[str]:
+    width, height = rng.randint(5, 17), rng.randint(5, 17)
+    rows = ["".join(rng.choice("#.") for _ in range(width)) for _ in range(height)]
+    # mirror rows or columns around a random line
+    transposed = rng.random() < 0.5
+    if transposed:
+        rows = ["".join(col) for col in zip(*rows)]
+    at = rng.randint(1, len(rows) - 1)
+    for i in range(min(at, len(rows) - at)):
+        rows[at + i] = rows[at - 1 - i]
+    return ["".join(col) for col in zip(*rows)] if transposed else rows
+
+def generate(rng: random.Random, scale: int) -> str:
+    return "\n\n".join("\n".join(pattern(rng)) for _ in range(100 * scale)) + "\n"
@@ -0,0 +1,10 @@
+import random
+
+def showing(rng: random.Random) -> str:
+    colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+    return ", ".join(f"{rng.randint(1, 20)} {c}" for c in colors)
+
+def generate(rng: random.Random, scale: int) -> str:
+    return "\n".join(
+        f"Game {id}: " + "; ".join(showing(rng) for _ in range(rng.randint(1, 6)))
+        for id in range(1, 100 * scale + 1)) + "\n"
@@ -0,0 +1,23 @@
+import math
+import random
+
+symbols = "*#+$/@=%-&"
+
+def generate(rng: random.Random, scale: int) -> str:
+    side = int(140 * math.sqrt(scale))
+    rows: list[list[str]] = []
+    for _ in range(side):
+        row = ""
+        while len(row) < side:
+            row += str(rng.randint(1, 999)) + "." if rng.random() < 0.12 else "."
+        rows.append(list(row[:side]))
+
+    # symbols never touch each other or the border, like in the real inputs
+    for _ in range(side * side // 18):
+        x, y = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        around = [rows[yy][xx]
+                  for yy in range(max(0, y - 1), min(side, y + 2))
+                  for xx in range(max(0, x - 1), min(side, x + 2))]
+        if rows[y][x] == "." and not any(c in symbols for c in around):
+            rows[y][x] = rng.choice(symbols)
+    return "\n".join("".join(row) for row in rows) + "\n"
@@ -0,0 +1,15 @@
+import random
+
+def generate(rng: random.Random, scale: int) -> str:
+    cards = 198 * scale
+    lines: list[str] = []
+    for id in range(1, cards + 1):
+        # winning copies may not point past the last card
+        matches = min(rng.choice([0, 0, 0, 1, 1, 2, 3, 4, 5, 10]), cards - id)
+        winning = rng.sample(range(1, 100), 10)
+        others = [n for n in range(1, 100) if n not in winning]
+        mine = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(mine)
+        fmt = lambda ns: " ".join(f"{n:>2}" for n in ns)
+        lines.append(f"Card {id:>{len(str(cards))}}: {fmt(winning)} | {fmt(mine)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,22 @@
+import random
+
+chain = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+limit = 2**32
+
+def transforms(rng: random.Random, n: int) -> list[str]:
+    # non overlapping source ranges in [0, 2^32)
+    cuts = sorted(rng.sample(range(1, limit), 2 * n))
+    out: list[str] = []
+    for start, end in zip(cuts[::2], cuts[1::2]):
+        span = end - start
+        out.append(f"{rng.randint(0, limit - span)} {start} {span}")
+    rng.shuffle(out)
+    return out
+
+def generate(rng: random.Random, scale: int) -> str:
+    seeds = [rng.randint(0, limit - 1) for _ in range(20 * scale)]
+    out = f"seeds: {' '.join(map(str, seeds))}\n"
+    for source, destination in zip(chain, chain[1:]):
+        out += f"\n{source}-to-{destination} map:\n"
+        out += "\n".join(transforms(rng, rng.randint(20, 45) * scale)) + "\n"
+    return out
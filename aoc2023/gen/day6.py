@@ -0,0 +1,9 @@
+import random
+
+def generate(rng: random.Random, scale: int) -> str:
+    times = [rng.randint(7, 99) for _ in range(4 * scale)]
+    # the record has to be beatable: holding for t/2 goes (t/2)^2
+    distances = [rng.randint(1, (t // 2) * (t - t // 2) - 1) for t in times]
+    width = max(len(str(n)) for n in times + distances) + 1
+    fmt = lambda ns: "".join(f"{n:>{width}}" for n in ns)
+    return f"Time:    {fmt(times)}\nDistance:{fmt(distances)}\n"
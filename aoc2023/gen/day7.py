@@ -0,0 +1,8 @@
+import random
+
+cards = "AKQJT98765432"
+
+def generate(rng: random.Random, scale: int) -> str:
+    return "\n".join(
+        f"{''.join(rng.choices(cards, k=5))} {rng.randint(1, 1000)}"
+        for _ in range(1000 * scale)) + "\n"
@@ -0,0 +1,45 @@
+import itertools
+import random
+
+primes = [p for p in range(3, 50) if all(p % d != 0 for d in range(2, p))]
+letters = "BCDEFGHIJKLMNOPQRSTUVWXY"
+
+def names(rng: random.Random, n: int) -> list[str]:
+    # never ending on A or Z, those are the start and goal nodes
+    length = 3
+    while 24**length < 2 * n:
+        length += 1
+    out: set[str] = set()
+    while len(out) < n:
+        out.add("".join(rng.choices(letters, k=length)))
+    # sorted first, set order changes between runs
+    shuffled = sorted(out)
+    rng.shuffle(shuffled)
+    return shuffled
+
+def generate(rng: random.Random, scale: int) -> str:
+    """
+    Six ghosts, each walking a chain of length route * p_i from its
+    xxA node to its xxZ node. The node after Z is the same as the node
+    after A, so the ghosts cycle with period route * p_i.
+    """
+    ghost_primes = rng.sample(primes, 6)
+    route_length = max(3, 728 * scale // sum(ghost_primes))
+    route = "".join(rng.choices("LR", k=route_length))
+    chain_nodes = names(rng, sum(route_length * p - 1 for p in ghost_primes))
+    decoys = iter(itertools.cycle(chain_nodes))
+
+    nodes: dict[str, tuple[str, str]] = {}
+    pool = iter(chain_nodes)
+    for i, p in enumerate(ghost_primes):
+        start, goal = ("AAA", "ZZZ") if i == 0 else (f"{i}{i}A", f"{i}{i}Z")
+        chain = [start] + [next(pool) for _ in range(route_length * p - 1)] + [goal]
+        for step, node in enumerate(chain[:-1]):
+            follow = chain[step + 1]
+            decoy = next(decoys)
+            nodes[node] = (follow, decoy) if route[step % route_length] == "L" else (decoy, follow)
+        nodes[goal] = nodes[start]
+
+    order = list(nodes.items())
+    rng.shuffle(order)
+    return f"{route}\n\n" + "\n".join(f"{n} = ({l}, {r})" for n, (l, r) in order) + "\n"
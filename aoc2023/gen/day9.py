@@ -0,0 +1,11 @@
+import random
+
+def generate(rng: random.Random, scale: int) -> str:
+    lines: list[str] = []
+    for _ in range(200 * scale):
+        # values of a polynomial, so the differences bottom out in zeros
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        lines.append(" ".join(
+            str(sum(c * x**i for i, c in enumerate(coefficients)))
+            for x in range(rng.randint(-5, 5), 21)))
+    return "\n".join(lines) + "\n"
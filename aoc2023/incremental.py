@@ -0,0 +1,63 @@
+import hashlib
+import os
+import sqlite3
+from dataclasses import dataclass
+from os import path
+from typing import Callable, Iterator
+from aoc2023.cache import cache_dir, sources_digest
+
+# Per line results of the Solver.line_parts, keyed by line content, so an
+# edited input only recomputes the lines that changed
+
+@dataclass
+class LineTotal():
+    total: int
+    lines: int
+    recomputed: int
+
+def chunks(xs: list[bytes], n: int = 500) -> Iterator[list[bytes]]:
+    for i in range(0, len(xs), n):
+        yield xs[i:i + n]
+
+class LineStore():
+    def __init__(self, db_file: str | None = None):
+        self.db_file = db_file or path.join(cache_dir(), "lines.sqlite")
+        os.makedirs(path.dirname(self.db_file), exist_ok=True)
+        self.db = sqlite3.connect(self.db_file, timeout=30)
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS lines (key BLOB PRIMARY KEY, value TEXT)")
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, int]:
+        found: dict[bytes, int] = {}
+        for chunk in chunks(keys):
+            rows = self.db.execute(
+                f"SELECT key, value FROM lines WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+            found |= {key: int(value) for key, value in rows}
+        return found
+
+    def put_many(self, values: dict[bytes, int]):
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO lines VALUES (?, ?)", [(k, str(v)) for k, v in values.items()])
+
+    def close(self):
+        self.db.close()
+
+def solve_lines(filename: str, day: int, part: int, line_part: Callable[[str], int],
+                store: LineStore, refresh: bool = False, sources: bytes | None = None) -> LineTotal:
+    """ Sum of line_part over the non empty lines, from the store where it can """
+    prefix = f"day{day}:part{part}:".encode() + (sources or sources_digest(day))
+    with open(filename, "rb") as f:
+        lines = [line for line in f.read().splitlines() if line.strip() != b""]
+
+    key: Callable[[bytes], bytes] = lambda line: hashlib.blake2b(prefix + line, digest_size=16).digest()
+    keys = [key(line) for line in lines]
+    known = {} if refresh else store.get_many(list(set(keys)))
+
+    fresh: dict[bytes, int] = {}
+    for k, line in zip(keys, lines):
+        if k not in known and k not in fresh:
+            fresh[k] = line_part(line.decode())
+    store.put_many(fresh)
+
+    results = known | fresh
+    return LineTotal(sum(results[k] for k in keys), len(lines), len(fresh))
@@ -0,0 +1,153 @@
+import math
+import multiprocessing
+from multiprocessing.connection import Connection
+import resource
+import signal
+import time
+import tomllib
+from dataclasses import dataclass, field, replace
+from aoc2023.runner import DayRun, PartRun, RunOptions
+from aoc2023.solver import solver_for
+
+@dataclass(frozen=True)
+class Limits():
+    # seconds of cpu time, RLIMIT_CPU
+    cpu: float | None = None
+    # address space in MiB, RLIMIT_AS
+    memory_mb: int | None = None
+    # seconds before the child is killed
+    wall: float | None = None
+
+    def over(self, other: "Limits") -> "Limits":
+        """ these limits, with the ones not set taken from other """
+        return Limits(
+            self.cpu if self.cpu is not None else other.cpu,
+            self.memory_mb if self.memory_mb is not None else other.memory_mb,
+            self.wall if self.wall is not None else other.wall)
+
+@dataclass
+class LimitsConfig():
+    default: Limits = Limits()
+    days: dict[int, Limits] = field(default_factory=dict)
+
+    def for_day(self, day: int) -> Limits:
+        return self.days.get(day, Limits()).over(self.default)
+
+def load_limits(toml_file: str) -> LimitsConfig:
+    """
+    Top level keys are the defaults, [dayN] tables override them:
+
+        cpu = 60
+        memory_mb = 4096
+        wall = 120
+
+        [day12]
+        wall = 30
+    """
+    with open(toml_file, "rb") as f:
+        data = tomllib.load(f)
+
+    def limits(table: dict[str, int | float]) -> Limits:
+        unknown = set(table) - {"cpu", "memory_mb", "wall"}
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown limits in {toml_file}: {', '.join(sorted(unknown))}")
+        return Limits(table.get("cpu"), table.get("memory_mb"), table.get("wall"))  # type: ignore
+
+    days = {int(k.removeprefix("day")): limits(v) for k, v in data.items() if k.startswith("day")}
+    return LimitsConfig(limits({k: v for k, v in data.items() if not k.startswith("day")}), days)
+
+def set_limits(limits: Limits):
+    if limits.cpu is not None:
+        seconds = math.ceil(limits.cpu)
+        # SIGXCPU at the soft limit, SIGKILL a second later
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+    if limits.memory_mb is not None:
+        size = limits.memory_mb * 2**20
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+
+def out_of_memory(limits: Limits) -> str:
+    return f"out of memory ({limits.memory_mb} MiB limit)"
+
+def solve_limited(sender: Connection, filename: str, day: int, part: int, options: RunOptions, limits: Limits):
+    """ Runs in the child, every part is sent as soon as it is solved and the whole day last """
+    from aoc2023.batch import solve_quietly
+    set_limits(limits)
+
+    def named(run: PartRun) -> PartRun:
+        if run.error is not None and run.error.startswith("MemoryError"):
+            return replace(run, error=out_of_memory(limits))
+        return run
+
+    result = solve_quietly(filename, day, part, options, on_part=lambda run: sender.send(named(run)))
+    result.parts = [named(r) for r in result.parts]
+    if result.error is not None and result.error.startswith("MemoryError"):
+        result.error = out_of_memory(limits)
+    sender.send(result)
+    sender.close()
+
+def children_cpu() -> float:
+    """ cpu seconds of the children waited for so far """
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+def died(exitcode: int | None, limits: Limits, cpu: float | None = None) -> str:
+    """
+    cpu is the seconds the child ran for. SIGKILL is the hard cpu limit,
+    but also what the kernel ends a process out of memory with, so with
+    a memory limit it's only a time out when the child used up its cpu.
+    """
+    match exitcode:
+        case code if code == -signal.SIGXCPU and limits.cpu is not None:
+            return f"timed out ({limits.cpu:g} s cpu limit)"
+        case code if code == -signal.SIGKILL and limits.cpu is not None and (
+                limits.memory_mb is None or (cpu is not None and cpu >= limits.cpu)):
+            return f"timed out ({limits.cpu:g} s cpu limit)"
+        case code if code is not None and code < 0 and limits.memory_mb is not None:
+            # allocations failing outside of Python tend to end in SIGSEGV or SIGABRT
+            return out_of_memory(limits)
+        case code:
+            return f"crashed with exit code {code}"
+
+def unfinished(day: int, part: int, solved: list[PartRun], reason: str, elapsed: float) -> DayRun:
+    """ The solved parts, the rest failed for reason """
+    try:
+        solver = solver_for(day)
+        expected = [] if solver is None else list(solver.parts(part))
+    except Exception:
+        expected = []
+    if len(expected) == 0:
+        return DayRun(day, total=elapsed, error=reason)
+    done = {r.part: r for r in solved}
+    parts = [done.get(p, PartRun(p, error=reason)) for p in expected]
+    return DayRun(day, parts=parts, total=elapsed)
+
+def solve_isolated(filename: str, day: int, part: int, options: RunOptions, limits: Limits) -> DayRun:
+    """ Solves a day in a child process under limits, killing it at the wall clock limit """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    child = multiprocessing.Process(target=solve_limited, args=(sender, filename, day, part, options, limits))
+    start = time.perf_counter()
+    # with a thread per day in a batch this may count other children too
+    cpu_before = children_cpu()
+    child.start()
+    sender.close()
+
+    solved: list[PartRun] = []
+    try:
+        while True:
+            remaining = None if limits.wall is None else max(0.0, start + limits.wall - time.perf_counter())
+            if not receiver.poll(remaining):
+                child.kill()
+                return unfinished(day, part, solved, f"timed out ({limits.wall:g} s wall clock limit)", time.perf_counter() - start)
+            try:
+                match receiver.recv():
+                    case PartRun() as run:
+                        solved.append(run)
+                    case DayRun() as result:
+                        return result
+            except EOFError:
+                child.join()
+                reason = died(child.exitcode, limits, children_cpu() - cpu_before)
+                return unfinished(day, part, solved, reason, time.perf_counter() - start)
+    finally:
+        child.join()
+        receiver.close()
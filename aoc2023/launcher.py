@@ -1,75 +1,228 @@
-import importlib
+from dataclasses import replace
+import glob
 from os import path
 import time
+from typing import TYPE_CHECKING
 import click
-from aoc2023 import unicode_symbols as u
-from aoc2023.unicode_symbols import FgColor, carousel, styled, Style
-
-def print_christmas_header(day:int, filename:str):
-    s = ""
-    s += f"{u.tree}{u.bell}{u.santa}   "
-    s += carousel(
-        "Advent of Code 2023!",
-        [FgColor.red],
-        [FgColor.green],
-        [FgColor.yellow],
-        base= [Style.bold, Style.underline])
-    s += "   "
-    s += f"{u.santa}{u.bell}{u.tree}"
-
-    print(s, end="\n\n")
-    print(f"{u.day} {day}: Running {filename}...".center(44))
-    print(f"\n{s}")
-
-@click.command()
+from aoc2023.runner import DayRun, RunOptions, data_filename, data_suffix, print_christmas_header, run_day, run_dynamic
+
+if TYPE_CHECKING:
+    from aoc2023.isolate import LimitsConfig
+
+@click.group(invoke_without_command=True)
+@click.pass_context
 @click.option("--data-folder", default="./data", help="Path to data folder")
 @click.option("-d", "--day", default=1, help="Day to verify")
-@click.option("-f", "--data-file", default=None, help="path to data file")
+@click.option("-f", "--data-file", default=None, help="path to data file, - or a pipe streams it (days 1, 2, 4, 9, 12 and 13)")
 @click.option("-x", "--example", is_flag=True, default=False)
 @click.option("-n", "--example-number", default=0, help="Example number")
+@click.option("-g", "--generated", default=0, help="Use the generated input of this scale, see aoc2023.gen")
 @click.option("-p", "--part", default=0, help="Which part")
-def cli(data_folder: str, day: int, data_file: str | None, example: bool, example_number: int, part: int):
+@click.option("-a", "--all", "all_days", is_flag=True, default=False, help="Run every implemented day")
+@click.option("--days", default=None, help="Days to run in one go, e.g. 1-13 or 1,3,5-7")
+@click.option("--inputs", default=None, help="Glob of inputs to solve the day over, e.g. 'data/day12*.aoc', without the answer cache")
+@click.option("-j", "--jobs", default=1, help="Worker processes used when running several days, or over chunks of lines for a single day (days 1, 2, 9 and 12)")
+@click.option("--profile", is_flag=True, default=False, help="Profile each run with cProfile")
+@click.option("--profile-dir", default="./profile", help="Where --profile and --sample-profile write their files")
+@click.option("--sample-profile", is_flag=True, default=False, help="Sample stacks on a cpu timer, writes .collapsed flame graph input to --profile-dir")
+@click.option("--sample-interval", default=5.0, help="Milliseconds of cpu time between --sample-profile samples")
+@click.option("--profile-top", default=15, help="How many functions --profile and --sample-profile print")
+@click.option("--mem", is_flag=True, default=False, help="Measure peak memory, allocation sites and gc activity per phase")
+@click.option("--mem-top", default=10, help="How many allocation sites --mem prints")
+@click.option("--mem-json", default=None, help="Also write the --mem measurements to this JSON file")
+@click.option("--trace", "trace_file", default=None, help="Write the traced spans as Chrome trace event JSON to this file")
+@click.option("--isolate", is_flag=True, default=False, help="Run every day in a child process, implied by the limits below")
+@click.option("--cpu-limit", default=None, type=float, help="CPU seconds per day (RLIMIT_CPU)")
+@click.option("--mem-limit", default=None, type=int, help="Address space per day in MiB (RLIMIT_AS)")
+@click.option("--timeout", default=None, type=float, help="Wall clock seconds per day")
+@click.option("--limits", "limits_file", default=None, help="TOML file with default and per day limits")
+@click.option("-q", "--quiet", is_flag=True, default=False, help="Skip all rendering, only print answers")
+@click.option("--incremental", is_flag=True, default=False, help="Keep per line results and only recompute changed lines (days 1, 2, 9 and 12)")
+@click.option("--no-cache", is_flag=True, default=False, help="Neither read nor store cached answers")
+@click.option("--refresh", is_flag=True, default=False, help="Recompute answers and update the cache")
+@click.option("--cache-stats", is_flag=True, default=False, help="Print answer cache statistics and exit")
+@click.option("--watch", is_flag=True, default=False, help="Keep running, re-run the day when its input or sources change")
+@click.option("--startup-report", is_flag=True, default=False, help="Show where startup import time goes and exit")
+@click.option("--startup-budget", default=100.0, help="Startup import budget in milliseconds for --startup-report")
+def cli(ctx: click.Context, data_folder: str, day: int, data_file: str | None, example: bool, example_number: int, generated: int, part: int,
+        all_days: bool, days: str | None, inputs: str | None, jobs: int, profile: bool, profile_dir: str,
+        sample_profile: bool, sample_interval: float, profile_top: int,
+        mem: bool, mem_top: int, mem_json: str | None, trace_file: str | None,
+        isolate: bool, cpu_limit: float | None, mem_limit: int | None, timeout: float | None, limits_file: str | None,
+        quiet: bool, incremental: bool, no_cache: bool, refresh: bool, cache_stats: bool, watch: bool, startup_report: bool, startup_budget: float):
     """Launches a day"""
-    ex_suffix = "" if not example else f"ex{'' if example_number == 0 else example_number}"
-    data_file = data_file if data_file is not None else f"day{day}{ex_suffix}.aoc"
-    filename = f"{data_folder}/{data_file}"
-
-    print_christmas_header(day, filename)
-
-    match day:
-        case n if 1 <= n <= 25:
-            run_dynamic(filename, n, part)
-        case _: print(f"{u.day} {day} not supported yet")
-
-def run_dynamic(filename: str, day: int, part: int):
-    if not path.exists(filename):
-        print(f"\n{u.warning}", end= " ")
-        print(styled(f"Oops! {filename} doesn't exist!", Style.framed, Style.bold, Style.underline) + f" {u.confused}")
-        print("Did you download the data for the day?")
+    if ctx.invoked_subcommand is not None:
+        return
+
+    if cache_stats:
+        from aoc2023 import cache
+        print(cache.AnswerCache().stats().pp())
+        return
+
+    if startup_report:
+        from aoc2023 import startup
+        report = startup.measure(day)
+        print(report.pp(startup_budget))
+        if report.total_ms() > startup_budget:
+            raise SystemExit(1)
+        return
+
+    options = RunOptions(
+        profile_dir=profile_dir if profile else None,
+        profile_top=profile_top,
+        quiet=quiet,
+        cache="off" if no_cache else "refresh" if refresh else "on",
+        mem=mem or mem_json is not None,
+        mem_top=mem_top,
+        sample_dir=profile_dir if sample_profile else None,
+        sample_interval=sample_interval / 1000,
+        trace=trace_file is not None,
+        incremental=incremental)
+
+    limits = None
+    if isolate or limits_file is not None or any(l is not None for l in (cpu_limit, mem_limit, timeout)):
+        from aoc2023 import isolate as isolation
+        limits = isolation.LimitsConfig() if limits_file is None else isolation.load_limits(limits_file)
+        # the options win over the defaults from the file
+        limits.default = isolation.Limits(cpu_limit, mem_limit, timeout).over(limits.default)
+
+    if all_days or days is not None:
+        from aoc2023 import batch
+        ex_suffix = data_suffix(example, example_number, generated)
+        results = run_many(data_folder, batch.parse_days("1-25" if days is None else days), part, ex_suffix, jobs, options, limits)
+        write_mem_json(mem_json, results)
+        write_trace(trace_file, results)
         return
 
-    try:
-        with open(filename) as file:
-            start_time = time.time()
+    if inputs is not None:
+        # a throughput run has to solve every input, not look up the answers of the last one
+        solving = replace(options, cache="off") if options.cache == "on" else options
+        results = run_inputs(sorted(glob.glob(inputs)), day, part, jobs, solving, limits)
+        write_mem_json(mem_json, results)
+        write_trace(trace_file, results)
+        return
+
+    filename = data_filename(data_folder, day, data_file, example, example_number, generated)
+    if limits is not None:
+        from aoc2023 import batch
+        from aoc2023.isolate import solve_isolated
+        start_time = time.perf_counter()
+        isolated = solve_isolated(filename, day, part, options, limits.for_day(day)) if path.exists(filename) else batch.missing_input(filename, day, part)
+        print(batch.format_table([isolated], time.perf_counter() - start_time))
+        write_mem_json(mem_json, [isolated])
+        write_trace(trace_file, [isolated])
+        return
+    if watch:
+        from aoc2023 import watch as watching
+        watching.watch(filename, day, part, options)
+        return
 
-            try:
-                importlib.import_module(
-                    f".day{day}",
-                    ".aoc2023"
-                    ).run(file, part)
-            except:
-                importlib.import_module(
-                    f".day{day}",
-                    ".aoc2023"
-                    ).run(file)
+    result = run_day(filename, day, part, replace(options, jobs=jobs))
+    write_mem_json(mem_json, [] if result is None else [result])
+    write_trace(trace_file, [] if result is None else [result])
+
+def run_many(data_folder: str, days: list[int], part: int, ex_suffix: str, jobs: int, options: RunOptions,
+             limits: "LimitsConfig | None" = None) -> list[DayRun]:
+    from aoc2023 import batch
+    start_time = time.perf_counter()
+    results = batch.run_batch(data_folder, days, part, ex_suffix, jobs, options, limits)
+    print(batch.format_table(results, time.perf_counter() - start_time, jobs))
+
+    if options.profile_dir is not None or options.sample_dir is not None:
+        print(f"\n{batch.format_profiles(results)}")
+
+    if options.mem:
+        from aoc2023 import memory
+        print(f"\n{memory.format_memory(results)}")
+    return results
+
+def run_inputs(filenames: list[str], day: int, part: int, jobs: int, options: RunOptions,
+               limits: "LimitsConfig | None") -> list[DayRun]:
+    from aoc2023 import batch
+    if len(filenames) == 0:
+        print("No inputs match")
+        return []
+    start_time = time.perf_counter()
+    results: list[DayRun] = []
+    for filename, result in batch.run_inputs(filenames, day, part, jobs, options, limits):
+        print(batch.format_input_run(filename, result), flush=True)
+        results.append(result)
+    print(batch.format_throughput(filenames, time.perf_counter() - start_time, jobs))
+    return results
+
+def write_trace(filename: str | None, results: list[DayRun]):
+    if filename is None:
+        return
+    import json
+    from aoc2023 import utils
+    with open(filename, "w") as f:
+        json.dump(utils.chrome_trace([s for r in results for s in r.spans]), f)
+
+def write_mem_json(filename: str | None, results: list[DayRun]):
+    if filename is None:
+        return
+    import json
+    from aoc2023 import memory
+    with open(filename, "w") as f:
+        json.dump(memory.memory_json(results), f, indent=2)
+
+@cli.command()
+@click.option("--data-folder", default="./data", help="Path to data folder")
+@click.option("-d", "--day", default=None, type=int, help="Day to benchmark")
+@click.option("--days", default=None, help="Days to benchmark, e.g. 1-13 or 1,3,5-7 (default all)")
+@click.option("-x", "--example", is_flag=True, default=False)
+@click.option("-n", "--example-number", default=0, help="Example number")
+@click.option("-g", "--generated", default=0, help="Use the generated input of this scale, see aoc2023.gen")
+@click.option("-p", "--part", default=0, help="Which part")
+@click.option("-r", "--runs", default=10, help="Timed runs per day")
+@click.option("--warmup", default=1, help="Untimed runs before the timed ones")
+@click.option("--threshold", default=0.1, help="Slowdown of the median over the baseline counted as a regression")
+@click.option("--baseline", default=None, help="Compare against the latest run at this git commit instead of the latest run")
+@click.option("--no-save", is_flag=True, default=False, help="Compare without storing the results")
+@click.option("--cached-models", is_flag=True, default=False, help="Load the parsed models from the model cache instead of parsing")
+def bench(data_folder: str, day: int | None, days: str | None, example: bool, example_number: int, generated: int,
+          part: int, runs: int, warmup: int, threshold: float, baseline: str | None, no_save: bool, cached_models: bool):
+    """Times days over several runs and compares them with earlier runs"""
+    from aoc2023 import batch
+    from aoc2023.bench import BenchHistory, Comparison, bench_day, format_comparisons, git_commit, input_hash
 
+    selected = [day] if day is not None else batch.parse_days("1-25" if days is None else days)
+    suffix = data_suffix(example, example_number, generated)
+    history = BenchHistory()
+    commit = git_commit()
 
+    comparisons: list[Comparison] = []
+    for d in batch.implemented_days(selected):
+        filename = f"{data_folder}/day{d}{suffix}.aoc"
+        if not path.exists(filename):
+            print(f"Skipping day {d}, {filename} doesn't exist")
+            continue
+        hashed = input_hash(filename)
+        for timing in bench_day(filename, d, part, runs, warmup, cached_models):
+            comparisons.append(Comparison(timing, history.baseline(d, timing.phase, hashed, baseline), threshold))
+            if not no_save:
+                history.add(timing, commit, hashed)
+    history.close()
 
-            print(f"--- {time.time() - start_time} seconds ---")
+    print(format_comparisons(comparisons))
+    regressions = [c for c in comparisons if c.regressed()]
+    print(f"--- {len(comparisons)} timings at {commit}, {len(regressions)} slower than {100 * threshold:.0f}% over the baseline ---")
+    if len(regressions) > 0:
+        raise SystemExit(1)
 
-    except ImportError as e:
-        print(f"Could not import day{day}: {e}")
+@cli.command()
+@click.option("--port", default=8023, help="Port on 127.0.0.1")
+@click.option("--socket", "socket_path", default=None, help="Listen on this Unix socket instead")
+@click.option("-j", "--jobs", default=None, type=int, help="Worker processes (default one per core)")
+def serve(port: int, socket_path: str | None, jobs: int | None):
+    """
+    Solves inputs sent over HTTP by a pool of warm workers, e.g.
+    curl --data-binary @data/day9.aoc 'localhost:8023/solve?day=9&part=2'
+    and curl localhost:8023/stats
+    """
+    from aoc2023 import service
+    service.serve(port, socket_path, jobs)
 
 
 if __name__ == '__main__':
-    cli()
\ No newline at end of file
+    cli()
@@ -0,0 +1,48 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from aoc2023.solver import solver_for
+from aoc2023.stream import sum_lines
+from aoc2023.utils import MappedInput
+
+# Days whose parts are sums over independent lines (Solver.line_parts) are
+# split into chunks of whole lines, summed in a pool and the sums added up
+
+def line_chunks(data: bytes | MappedInput, count: int) -> list[tuple[int, int]]:
+    """ byte ranges of about len(data) / count, every one ending after a line break """
+    raw = data.data if isinstance(data, MappedInput) else data
+    size = len(raw)
+    chunks: list[tuple[int, int]] = []
+    start = 0
+    for i in range(1, count + 1):
+        end = size if i == count else raw.find(b"\n", max(start, size * i // count))
+        end = size if end == -1 else min(size, end + 1)
+        if end > start:
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+def solve_chunk(filename: str, day: int, parts: list[int], start: int, end: int) -> dict[int, int]:
+    solver = solver_for(day)
+    if solver is None or solver.line_parts is None:
+        raise NotImplementedError(f"day{day} has no line_parts to map over")
+    with MappedInput.open(filename) as mapped:
+        lines = str(mapped.data[start:end], "utf-8").splitlines()
+    return sum_lines({p: solver.line_parts[p] for p in parts}, lines)
+
+def solve_chunked(filename: str, day: int, parts: list[int], jobs: int | None = None,
+                  chunks_per_job: int = 4) -> dict[int, int]:
+    """
+    More chunks than workers, so a chunk of slow lines doesn't keep the
+    other workers waiting at the end
+    """
+    jobs = jobs or os.cpu_count() or 1
+    with MappedInput.open(filename) as mapped:
+        chunks = line_chunks(mapped, jobs * chunks_per_job)
+
+    totals = {p: 0 for p in parts}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(solve_chunk, filename, day, parts, start, end) for start, end in chunks]
+        for future in futures:
+            for p, total in future.result().items():
+                totals[p] += total
+    return totals
@@ -0,0 +1,129 @@
+import gc
+from os import path
+import resource
+import sys
+import threading
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from aoc2023.runner import DayRun
+
+T = TypeVar("T")
+
+@dataclass
+class AllocationSite():
+    site: str
+    size: int
+    count: int
+
+@dataclass
+class PhaseMemory():
+    # high water mark of the whole process after the phase, in bytes
+    peak_rss: int = 0
+    # peak of what the phase itself allocated, in bytes
+    traced_peak: int = 0
+    # where the memory was when the phase had the most traced, see PeakSnapshot
+    top_sites: list[AllocationSite] = field(default_factory=list)
+    # traced bytes when top_sites was taken, close to traced_peak
+    sites_traced: int = 0
+    # collections started per gc generation while the phase ran
+    gc_collections: list[int] = field(default_factory=lambda: [0, 0, 0])
+    gc_collected: int = 0
+
+    def pp(self) -> str:
+        mib = lambda n: f"{n / 2**20:.1f} MiB"
+        out = [
+            f"peak rss {mib(self.peak_rss)}, traced peak {mib(self.traced_peak)}",
+            f"gc collections {'/'.join(map(str, self.gc_collections))} (gen 0/1/2), {self.gc_collected} objects collected",
+            f"top sites at {mib(self.sites_traced)} traced"]
+        out += [f"  {mib(s.size):>10} {s.count:>9} blocks  {s.site}" for s in self.top_sites]
+        return "\n".join(out)
+
+    def to_json(self) -> dict[str, Any]:
+        return asdict(self)
+
+def peak_rss() -> int:
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macOS
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+class PeakSnapshot():
+    """
+    The tracemalloc snapshot taken at the most traced memory seen so far.
+    A new one is only taken once traced memory grew by growth over the
+    last, so the snapshots cost a few times the one at the peak at most.
+    """
+    def __init__(self, growth: float = 1.25):
+        self.growth = growth
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.traced = 0
+        # snapshots allocate, which can start a gc and call check again
+        self.lock = threading.Lock()
+
+    def check(self):
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            current, _ = tracemalloc.get_traced_memory()
+            if self.snapshot is None or current > self.traced * self.growth:
+                self.snapshot, self.traced = tracemalloc.take_snapshot(), current
+        finally:
+            self.lock.release()
+
+    def watch(self, stop: threading.Event, interval: float):
+        """ checks on a timer, for phases that allocate without starting a gc """
+        while not stop.wait(interval):
+            self.check()
+
+def measure_call(fn: Callable[[], T], top: int = 10, interval: float = 0.005) -> tuple[T, PhaseMemory]:
+    memory = PhaseMemory()
+    peak = PeakSnapshot()
+
+    def on_gc(phase: str, info: dict[str, int]):
+        if phase == "start":
+            memory.gc_collections[info["generation"]] += 1
+            # before the collection, while the garbage still counts
+            peak.check()
+        else:
+            memory.gc_collected += info["collected"]
+
+    stop = threading.Event()
+    watcher = threading.Thread(target=peak.watch, args=(stop, interval), daemon=True)
+    watcher.start()
+    gc.callbacks.append(on_gc)
+    tracemalloc.start()
+    try:
+        result = fn()
+        peak.check()
+        _, memory.traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        stop.set()
+        watcher.join()
+        tracemalloc.stop()
+        gc.callbacks.remove(on_gc)
+
+    assert peak.snapshot is not None
+    memory.sites_traced = peak.traced
+    # the watcher waiting on its timer is not the phase's
+    snapshot = peak.snapshot.filter_traces([
+        tracemalloc.Filter(False, f) for f in [tracemalloc.__file__, threading.__file__, __file__]])
+    memory.top_sites = [
+        AllocationSite(f"{path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}", stat.size, stat.count)
+        for stat in snapshot.statistics("lineno")[:top]]
+    memory.peak_rss = peak_rss()
+    return result, memory
+
+def format_memory(results: list["DayRun"]) -> str:
+    return "\n\n".join([
+        f"--- day {r.day} {name} memory ---\n{mem.pp()}"
+        for r in results
+        for name, mem in r.memory.items()])
+
+def memory_json(results: list["DayRun"]) -> list[dict[str, Any]]:
+    """ one entry per day and phase, for the benchmark tooling """
+    return [
+        {"day": r.day, "phase": name, **mem.to_json()}
+        for r in results
+        for name, mem in r.memory.items()]
@@ -0,0 +1,53 @@
+import hashlib
+import os
+from os import path
+import pickle
+import zlib
+from typing import Any
+from aoc2023.cache import cache_dir, digests
+from aoc2023.solver import Solver
+
+# Parsed models, pickled and compressed, so that repeat runs skip parsing.
+# A file is a header followed by the zlib compressed pickle.
+MAGIC = b"AOCM"
+FORMAT = 1
+HEADER = MAGIC + bytes([FORMAT, pickle.HIGHEST_PROTOCOL])
+
+def model_key(filename: str, day: int, solver: Solver[Any], known: tuple[bytes, bytes] | None = None) -> str:
+    """ Same input, same day sources and same Solver.version, known as in cache.answer_key """
+    h = hashlib.sha256()
+    h.update(f"day{day}:v{solver.version}\n".encode())
+    for digest in known or digests(filename, day):
+        h.update(digest)
+    return h.hexdigest()
+
+def model_file(day: int, key: str, models_dir: str | None = None) -> str:
+    return path.join(models_dir or path.join(cache_dir(), "models"), f"day{day}-{key[:24]}.model")
+
+def load(model_path: str) -> Any | None:
+    try:
+        with open(model_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    if not data.startswith(HEADER):
+        return None
+    try:
+        return pickle.loads(zlib.decompress(data[len(HEADER):]))
+    except Exception:
+        # written by something older, it is parsed again and replaced
+        return None
+
+def store(model_path: str, model: Any) -> bool:
+    """ False for models that can't be pickled, like generators or memoryviews """
+    try:
+        data = zlib.compress(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL), 1)
+    except (TypeError, pickle.PicklingError, AttributeError):
+        return False
+    os.makedirs(path.dirname(model_path), exist_ok=True)
+    # written next to it and moved in place, parallel runs never see half a file
+    tmp = f"{model_path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER + data)
+    os.replace(tmp, model_path)
+    return True
@@ -0,0 +1,29 @@
+import cProfile
+import io
+import pstats
+import re
+from os import makedirs, path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+def pstats_file(profile_dir: str, day: int, phase: str) -> str:
+    """ one file per day and phase, e.g. day7-parse.pstats and day7-part2.pstats """
+    return path.join(profile_dir, f"day{day}-{phase}.pstats")
+
+def profile_call(fn: Callable[[], T], out_file: str) -> T:
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        makedirs(path.dirname(out_file) or ".", exist_ok=True)
+        profiler.dump_stats(out_file)
+
+def top_functions(stats_file: str, n: int, skip: str | None = None) -> str:
+    """ the n functions with the most cumulative time, those defined in the skip file left out """
+    out = io.StringIO()
+    stats = pstats.Stats(stats_file, stream=out)
+    # print_stats takes regexes over "file:line(function)" to filter by before the top n
+    restrictions = [] if skip is None else [f"^(?!{re.escape(path.basename(skip))}:)"]
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(*restrictions, n)
+    return out.getvalue().strip("\n")
@@ -0,0 +1,340 @@
+from dataclasses import dataclass, field
+import contextlib
+import importlib
+import inspect
+import os
+from os import path
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, TypeVar
+from aoc2023 import utils
+from aoc2023.solver import solver_for
+
+if TYPE_CHECKING:
+    from aoc2023.memory import PhaseMemory
+
+# Everything here runs before a day gets to solve anything, so the
+# rendering, cache and profiling modules are only imported when used.
+
+CacheMode = Literal["on", "off", "refresh"]
+T = TypeVar("T")
+
+@dataclass
+class RunOptions():
+    # write a cProfile .pstats file per day/part into this folder
+    profile_dir: str | None = None
+    profile_top: int = 15
+    # skip rendering in the days and only print answers
+    quiet: bool = False
+    # "refresh" skips lookups but still stores the new answers
+    cache: CacheMode = "on"
+    # measure memory per phase, with this many allocation sites
+    mem: bool = False
+    mem_top: int = 10
+    # write sampled .collapsed stacks per day/part into this folder
+    sample_dir: str | None = None
+    sample_interval: float = 0.005
+    # record utils.span spans into DayRun.spans
+    trace: bool = False
+    # sum the Solver.line_parts from per line results, recomputing changed lines only
+    incremental: bool = False
+    # sum the Solver.line_parts over chunks of the input in this many processes
+    jobs: int = 1
+
+    def uses_cache(self) -> bool:
+        # profiled and measured runs have to actually run
+        return (self.cache != "off" and self.profile_dir is None and self.sample_dir is None
+                and not self.mem and not self.trace)
+
+def data_suffix(example: bool, example_number: int, generated: int = 0) -> str:
+    """ dayN<suffix>.aoc, generated inputs are written by aoc2023.gen """
+    if generated > 0:
+        return f"gen{generated}"
+    return "" if not example else f"ex{'' if example_number == 0 else example_number}"
+
+def data_filename(data_folder: str, day: int, data_file: str | None, example: bool, example_number: int,
+                  generated: int = 0) -> str:
+    if data_file == "-":
+        return data_file
+    ex_suffix = data_suffix(example, example_number, generated)
+    data_file = data_file if data_file is not None else f"day{day}{ex_suffix}.aoc"
+    # an absolute data_file, like a /dev/fd pipe, is taken as it is
+    return path.join(data_folder, data_file)
+
+def print_christmas_header(day:int, filename:str):
+    from aoc2023 import unicode_symbols as u
+    from aoc2023.unicode_symbols import FgColor, carousel, Style
+
+    s = ""
+    s += f"{u.tree}{u.bell}{u.santa}   "
+    s += carousel(
+        "Advent of Code 2023!",
+        [FgColor.red],
+        [FgColor.green],
+        [FgColor.yellow],
+        base= [Style.bold, Style.underline])
+    s += "   "
+    s += f"{u.santa}{u.bell}{u.tree}"
+
+    print(s, end="\n\n")
+    print(f"{u.day} {day}: Running {filename}...".center(44))
+    print(f"\n{s}")
+
+def run_day(filename: str, day: int, part: int, options: RunOptions) -> "DayRun | None":
+    """ Single day run as done by the launcher, header included """
+    utils.set_quiet(options.quiet)
+    if not options.quiet:
+        print_christmas_header(day, filename)
+
+    match day:
+        case n if 1 <= n <= 25:
+            return run_dynamic(filename, n, part, options)
+        case _:
+            from aoc2023 import unicode_symbols as u
+            print(f"{u.day} {day} not supported yet")
+            return None
+
+@dataclass
+class PartRun():
+    part: int
+    answer: str = ""
+    solve: float = 0.0
+    cached: bool = False
+    error: str | None = None
+    # incremental runs: (recomputed, total) lines
+    lines: tuple[int, int] | None = None
+
+@dataclass
+class DayRun():
+    day: int
+    parts: list[PartRun] = field(default_factory=list)
+    parse: float = 0.0
+    # the parse time is the time it took to load the model from aoc2023.models
+    model_cached: bool = False
+    total: float = 0.0
+    error: str | None = None
+    # top functions per profiled phase
+    profiles: dict[str, str] = field(default_factory=dict)
+    # per phase, when measuring memory
+    memory: dict[str, "PhaseMemory"] = field(default_factory=dict)
+    # when tracing
+    spans: list[utils.Span] = field(default_factory=list)
+
+def solve_day(filename: str, day: int, part: int, options: RunOptions, render: bool = False,
+              on_part: Callable[[PartRun], None] | None = None) -> DayRun:
+    """
+    Parses the input once and solves the requested parts (0 for all) from
+    that model, on_part gets every part as soon as it is done
+    """
+    result = DayRun(day)
+    start_time = time.perf_counter()
+
+    def done(run: PartRun):
+        result.parts.append(run)
+        if on_part is not None:
+            on_part(run)
+
+    def sampled(name: str, solve: Callable[[], T]) -> T:
+        if options.sample_dir is None:
+            return solve()
+        from aoc2023 import sampling
+        # the wrappers around solve are all in here, like for profiled
+        sampler = sampling.StackSampler(options.sample_interval, skip=__file__)
+        try:
+            return sampler.run(solve)
+        finally:
+            sampling.write_collapsed(sampler, sampling.collapsed_file(options.sample_dir, day, name))
+            result.profiles[f"{name} samples"] = sampler.summary(options.profile_top)
+
+    def profiled(name: str, solve: Callable[[], T]) -> T:
+        if options.profile_dir is None:
+            return sampled(name, solve)
+        from aoc2023 import profiling
+        stats_file = profiling.pstats_file(options.profile_dir, day, name)
+        try:
+            return profiling.profile_call(lambda: sampled(name, solve), stats_file)
+        finally:
+            # the harness wrapping solve is on top of every listing, leave it out
+            result.profiles[name] = profiling.top_functions(stats_file, options.profile_top, skip=__file__)
+
+    def measured(name: str, solve: Callable[[], T]) -> T:
+        if not options.mem:
+            return profiled(name, solve)
+        from aoc2023 import memory
+        out, result.memory[name] = memory.measure_call(lambda: profiled(name, solve), options.mem_top)
+        return out
+
+    def phase(name: str, solve: Callable[[], T]) -> T:
+        with utils.span(name, day=day):
+            return measured(name, solve)
+
+    if options.trace:
+        utils.start_tracing()
+
+    # the cache and line stores of this day, closed when it is done
+    stores = contextlib.ExitStack()
+    try:
+        solver = solver_for(day)
+        if solver is None:
+            raise NotImplementedError(f"day{day} has no solver")
+        parts = solver.parts(part)
+
+        keys: dict[int, str] = {}
+        # the input and the day's sources are hashed once for every key
+        known: tuple[bytes, bytes] | None = None
+        if options.uses_cache():
+            from aoc2023 import cache
+            store = stores.enter_context(contextlib.closing(cache.AnswerCache()))
+            known = cache.digests(filename, day, store)
+            keys = {p: cache.answer_key(filename, day, p, known) for p in parts}
+            for p, key in keys.items():
+                match store.get(key) if options.cache == "on" else None:
+                    case None:
+                        pass
+                    case hit:
+                        done(PartRun(p, hit.output, hit.solve, cached=True))
+
+        def finish(run: PartRun):
+            if run.error is None and run.part in keys:
+                store.put(keys[run.part], day, run.part, run.answer, run.solve)
+            done(run)
+
+        def solve_part(p: int, solve: Callable[[PartRun], None]):
+            """ solve fills in the answer of run, its time and error are taken here """
+            run = PartRun(p)
+            part_start = time.perf_counter()
+            try:
+                solve(run)
+            except Exception as e:
+                run.error = f"{type(e).__name__}: {e}"
+            run.solve = time.perf_counter() - part_start
+            finish(run)
+
+        def unsolved(candidates: Iterable[int]) -> list[int]:
+            return [p for p in candidates if p in parts and p not in {r.part for r in result.parts}]
+
+        if options.incremental and options.cache != "off" and solver.line_parts is not None:
+            from aoc2023 import incremental
+            lines = stores.enter_context(contextlib.closing(incremental.LineStore()))
+            line_parts = solver.line_parts
+
+            def solve_lines(run: PartRun):
+                total = phase(f"part{run.part}", lambda: incremental.solve_lines(
+                    filename, day, run.part, line_parts[run.part], lines,
+                    refresh=options.cache == "refresh", sources=None if known is None else known[1]))
+                run.answer, run.lines = f"{total.total}", (total.recomputed, total.lines)
+
+            for p in unsolved(solver.line_parts):
+                solve_part(p, solve_lines)
+
+        if options.jobs > 1 and solver.line_parts is not None and len(line_todo := unsolved(solver.line_parts)) > 0:
+            from aoc2023 import mapreduce
+            chunked_start = time.perf_counter()
+            totals: dict[int, int] = {}
+            error = None
+            try:
+                totals = phase("chunked", lambda: mapreduce.solve_chunked(filename, day, line_todo, options.jobs))
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            # one pass over the input solves all of them, they share its time
+            share = (time.perf_counter() - chunked_start) / len(line_todo)
+            for p in line_todo:
+                finish(PartRun(p, f"{totals[p]}" if error is None else "", share, error=error))
+
+        # when every answer is cached the input is not even parsed
+        todo = {p: parts[p] for p in unsolved(parts)}
+        if len(todo) > 0:
+            parse_start = time.perf_counter()
+            model_path = None
+            model = None
+            if options.uses_cache():
+                from aoc2023 import models
+                model_path = models.model_file(day, models.model_key(filename, day, solver, known))
+                if options.cache == "on":
+                    model = models.load(model_path)
+            result.model_cached = model is not None
+
+            if model is None:
+                with solver.open(filename) as file:
+                    model = phase("parse", lambda: solver.parse(file))
+            result.parse = time.perf_counter() - parse_start
+            if model_path is not None and not result.model_cached:
+                models.store(model_path, model)
+
+            if render and solver.render is not None:
+                with utils.span("render", day=day):
+                    solver.render(model)
+
+            for p, solve in todo.items():
+                def solve_model(run: PartRun):
+                    run.answer = f"{phase(f'part{run.part}', lambda: solve(model))}"
+                solve_part(p, solve_model)
+
+        result.parts.sort(key=lambda r: r.part)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        stores.close()
+
+    result.total = time.perf_counter() - start_time
+    if options.trace:
+        result.spans = utils.stop_tracing()
+        result.spans.append(utils.Span(f"day {day}", start_time, result.total, os.getpid(), threading.get_ident()))
+    return result
+
+def run_dynamic(filename: str, day: int, part: int, options: RunOptions = RunOptions()) -> DayRun | None:
+    """ Solves and prints a day, the result is None for legacy and missing days """
+    from aoc2023 import stream
+    streamed = stream.is_stream(filename)
+    if not streamed and not path.exists(filename):
+        from aoc2023 import unicode_symbols as u
+        from aoc2023.unicode_symbols import styled, Style
+        print(f"\n{u.warning}", end= " ")
+        print(styled(f"Oops! {filename} doesn't exist!", Style.framed, Style.bold, Style.underline) + f" {u.confused}")
+        print("Did you download the data for the day?")
+        return None
+
+    try:
+        solver = solver_for(day)
+    except ImportError as e:
+        print(f"Could not import day{day}: {e}")
+        return None
+
+    if solver is None and not streamed:
+        run_legacy(filename, day, part)
+        return None
+
+    if streamed:
+        result = stream.solve_stream(filename, day, part)
+    else:
+        result = solve_day(filename, day, part, options, render=not options.quiet)
+    if result.error is not None:
+        print(f"day{day} failed: {result.error}")
+
+    for r in result.parts:
+        answer = r.answer if r.error is None else f"failed with {r.error}"
+        lines = "" if r.lines is None else f" ({r.lines[0]} of {r.lines[1]} lines recomputed)"
+        print(f"Part {r.part}: {answer}{' (cached)' if r.cached else ''}{lines}")
+
+    timings = ", ".join([f"parse {result.parse:.6f}{' (cached model)' if result.model_cached else ''}"] + [f"part {r.part} {r.solve:.6f}" for r in result.parts])
+    if streamed:
+        timings = "streamed, every part in one pass"
+    print(f"--- {result.total} seconds ({timings}) ---")
+
+    for name, profile in result.profiles.items():
+        print(f"\n--- {name} ---\n{profile}")
+
+    for name, mem in result.memory.items():
+        print(f"\n--- {name} memory ---\n{mem.pp()}")
+    return result
+
+def run_legacy(filename: str, day: int, part: int):
+    """ Days without a registered solver only have a run(file[, part]) """
+    run = importlib.import_module(f".day{day}", "aoc2023").run
+    with open(filename) as file:
+        start_time = time.time()
+        if "part" in inspect.signature(run).parameters:
+            run(file, part)
+        else:
+            run(file)
+        print(f"--- {time.time() - start_time} seconds ---")
@@ -0,0 +1,73 @@
+import signal
+import sys
+import time
+from collections import Counter
+from os import makedirs, path
+from types import FrameType
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+def collapsed_file(profile_dir: str, day: int, phase: str) -> str:
+    """ day7-part2.collapsed, for flamegraph.pl, speedscope and friends """
+    return path.join(profile_dir, f"day{day}-{phase}.collapsed")
+
+def frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{path.basename(code.co_filename).removesuffix('.py')}.{code.co_qualname}"
+
+class StackSampler():
+    """
+    Samples the stack on every ITIMER_PROF tick, so only cpu time is
+    sampled. Frames above the sampled call are left out, and so are the
+    ones of the skip file at the root of a stack, the harness around it.
+    """
+    def __init__(self, interval: float = 0.005, skip: str | None = None):
+        self.interval = interval
+        self.skip = skip
+        self.stacks: Counter[str] = Counter()
+        self.overhead = 0.0
+        self.elapsed = 0.0
+        self.root: FrameType | None = None
+
+    def sample(self, signum: int, frame: FrameType | None):
+        start = time.perf_counter()
+        frames: list[FrameType] = []
+        while frame is not None and frame is not self.root:
+            frames.append(frame)
+            frame = frame.f_back
+        # root last
+        while len(frames) > 0 and frames[-1].f_code.co_filename == self.skip:
+            frames.pop()
+        self.stacks[";".join(frame_name(f) for f in reversed(frames))] += 1
+        self.overhead += time.perf_counter() - start
+
+    def run(self, fn: Callable[[], T]) -> T:
+        self.root = sys._getframe()
+        previous = signal.signal(signal.SIGPROF, self.sample)
+        start = time.perf_counter()
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return fn()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            self.elapsed += time.perf_counter() - start
+            signal.signal(signal.SIGPROF, previous)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common() if stack != "")
+
+    def summary(self, top: int = 15) -> str:
+        samples = sum(self.stacks.values())
+        overhead = 0 if self.elapsed == 0 else 100 * self.overhead / self.elapsed
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rpartition(";")[2]] += count
+        out = [f"{samples} samples every {1000 * self.interval:g} ms, {overhead:.1f}% sampling overhead"]
+        out += [f"  {100 * count / samples:5.1f}%  {leaf}" for leaf, count in leaves.most_common(top)]
+        return "\n".join(out)
+
+def write_collapsed(sampler: StackSampler, out_file: str):
+    makedirs(path.dirname(out_file) or ".", exist_ok=True)
+    with open(out_file, "w") as f:
+        f.write(sampler.collapsed())
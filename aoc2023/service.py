@@ -0,0 +1,166 @@
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import socketserver
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.pool import Pool
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+from aoc2023 import utils
+from aoc2023.solver import solver_for
+
+# POST /solve?day=9&part=2 with the input as body, GET /stats for the numbers
+
+def warm_up():
+    """ Worker initializer, every day is imported before the first request """
+    from aoc2023.batch import implemented_days
+    utils.set_quiet(True)
+    implemented_days(list(range(1, 26)))
+
+def solve_input(day: int, part: int, data: bytes) -> dict[str, str]:
+    solver = solver_for(day)
+    if solver is None:
+        raise ValueError(f"day{day} has no solver")
+    with contextlib.redirect_stdout(io.StringIO()):
+        file = utils.MappedInput(data) if solver.mapped else io.StringIO(data.decode())
+        model = solver.parse(file)
+        return {str(p): f"{solve(model)}" for p, solve in solver.parts(part).items()}
+
+def percentile(ordered: list[float], q: float) -> float:
+    # nearest rank
+    return 0.0 if len(ordered) == 0 else ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+@dataclass
+class DayStats():
+    requests: int = 0
+    errors: int = 0
+    input_bytes: int = 0
+    busy: float = 0.0
+
+@dataclass
+class ServiceStats():
+    started: float = field(default_factory=time.perf_counter)
+    queued: int = 0
+    # the latest latencies, enough for stable percentiles
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=10000))
+    days: dict[int, DayStats] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, day: int, input_bytes: int, latency: float, failed: bool):
+        with self.lock:
+            stats = self.days.setdefault(day, DayStats())
+            stats.requests += 1
+            stats.errors += failed
+            stats.input_bytes += input_bytes
+            stats.busy += latency
+            self.latencies.append(latency)
+
+    def to_json(self) -> dict[str, Any]:
+        with self.lock:
+            uptime = time.perf_counter() - self.started
+            ordered = sorted(self.latencies)
+            return {
+                "uptime": uptime,
+                "queue_depth": self.queued,
+                "latency_ms": {
+                    name: 1000 * percentile(ordered, q)
+                    for name, q in [("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0)]},
+                "days": {
+                    day: {
+                        "requests": s.requests,
+                        "errors": s.errors,
+                        "requests_per_s": s.requests / uptime,
+                        "mb_per_s": s.input_bytes / 1e6 / uptime,
+                        "mean_latency_ms": 1000 * s.busy / s.requests}
+                    for day, s in sorted(self.days.items())}}
+
+class SolveHandler(BaseHTTPRequestHandler):
+    # set by serve on the server class
+    pool: Pool
+    stats: ServiceStats
+
+    def reply(self, status: int, body: dict[str, Any]):
+        out = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def do_GET(self):
+        match urlparse(self.path).path:
+            case "/stats":
+                self.reply(200, self.stats.to_json())
+            case _:
+                self.reply(404, {"error": f"no such endpoint {self.path}"})
+
+    def do_POST(self):
+        start = time.perf_counter()
+        url = urlparse(self.path)
+        if url.path != "/solve":
+            self.reply(404, {"error": f"no such endpoint {self.path}"})
+            return
+        try:
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            day, part = int(query["day"]), int(query.get("part", 0))
+        except (KeyError, ValueError):
+            self.reply(400, {"error": "expected /solve?day=<day>[&part=<part>]"})
+            return
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        with self.stats.lock:
+            self.stats.queued += 1
+        try:
+            answers = self.pool.apply_async(solve_input, (day, part, data)).get()
+            failed = None
+        except Exception as e:
+            answers, failed = {}, f"{type(e).__name__}: {e}"
+        finally:
+            with self.stats.lock:
+                self.stats.queued -= 1
+
+        latency = time.perf_counter() - start
+        self.stats.record(day, len(data), latency, failed is not None)
+        if failed is None:
+            self.reply(200, {"day": day, "answers": answers, "seconds": latency})
+        else:
+            self.reply(500, {"day": day, "error": failed, "seconds": latency})
+
+    def log_message(self, format: str, *args: Any):
+        pass
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        # http.server expects an (address, port) client address
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+def make_server(port: int = 8023, socket_path: str | None = None, jobs: int | None = None) -> socketserver.BaseServer:
+    """ The pool is forked up front, with every day imported by warm_up """
+    pool = multiprocessing.Pool(jobs or os.cpu_count(), initializer=warm_up)
+    handler = type("Handler", (SolveHandler,), {"pool": pool, "stats": ServiceStats()})
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        return UnixHTTPServer(socket_path, handler)
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+def serve(port: int = 8023, socket_path: str | None = None, jobs: int | None = None):
+    server = make_server(port, socket_path, jobs)
+    where = socket_path if socket_path is not None else f"http://127.0.0.1:{port}"
+    print(f"Solving on {where} with {jobs or os.cpu_count()} workers, ctrl-c to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.RequestHandlerClass.pool.terminate()  # type: ignore
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+import importlib
+from typing import Any, Callable, Generic, Iterable, TextIO, TypeVar
+from aoc2023.utils import MappedInput, quiet
+
+M = TypeVar("M")
+
+@dataclass(frozen=True)
+class Solver(Generic[M]):
+    """
+    How a day is solved: the input is parsed once into a model that is
+    then shared by both parts.
+    """
+    parse: Callable[[Any], M]
+    part1: Callable[[M], Any]
+    part2: Callable[[M], Any] | None = None
+    # pretty printing of the model, skipped when quiet
+    render: Callable[[M], None] | None = None
+    # parse gets a utils.MappedInput instead of a text file
+    mapped: bool = False
+    # bump when the parsed model changes shape, cached models are dropped
+    version: int = 1
+    # for days where a part is a sum over independent lines: what a single
+    # input line adds to that part, so only changed lines are recomputed
+    line_parts: dict[int, Callable[[str], int]] | None = None
+    # every part in one pass over the input lines, for inputs that can only
+    # be read once like stdin. Days with line_parts stream without it
+    stream: Callable[[Iterable[str]], dict[int, Any]] | None = None
+
+    def open(self, filename: str) -> TextIO | MappedInput:
+        return MappedInput.open(filename) if self.mapped else open(filename)
+
+    def parts(self, part: int = 0) -> dict[int, Callable[[M], Any]]:
+        """ part 0 means every part the day has """
+        available = {1: self.part1} if self.part2 is None else {1: self.part1, 2: self.part2}
+        return available if part == 0 else {p: f for p, f in available.items() if p == part}
+
+    def run(self, file: TextIO, part: int = 0):
+        if self.mapped:
+            with MappedInput.of_file(file) as mapped:
+                model = self.parse(mapped)
+        else:
+            model = self.parse(file)
+        if self.render is not None and not quiet():
+            self.render(model)
+        for n, solve in self.parts(part).items():
+            print(f"Part {n}: {solve(model)}")
+
+registry: dict[int, Solver[Any]] = {}
+
+def register(day: int, solver: Solver[M]) -> Solver[M]:
+    registry[day] = solver
+    return solver
+
+def solver_for(day: int) -> Solver[Any] | None:
+    # days register themselves when imported
+    importlib.import_module(f".day{day}", "aoc2023")
+    return registry.get(day)
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+import os
+from os import path
+import py_compile
+import re
+import stat
+import subprocess
+import sys
+import tempfile
+import zipfile
+import click
+
+@dataclass
+class ImportTime():
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+@dataclass
+class StartupReport():
+    imports: list[ImportTime]
+
+    def total_ms(self) -> float:
+        return sum(i.cumulative_us for i in self.imports if i.depth == 0) / 1000
+
+    def pp(self, budget_ms: float, top: int = 15) -> str:
+        slowest = sorted(self.imports, key=lambda i: i.cumulative_us, reverse=True)[:top]
+        total = self.total_ms()
+        verdict = "within" if total <= budget_ms else "OVER"
+        return "\n".join([
+            f"{'self ms':>8} {'cumul ms':>9}  module",
+            *[f"{i.self_us / 1000:8.1f} {i.cumulative_us / 1000:9.1f}  {'  ' * i.depth}{i.module}" for i in slowest],
+            f"--- {total:.1f} ms importing, {verdict} the {budget_ms:.0f} ms budget ---"])
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    out: list[ImportTime] = []
+    for line in stderr.splitlines():
+        match re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)", line):
+            case None:
+                pass
+            case m:
+                out.append(ImportTime(m[4], int(m[1]), int(m[2]), (len(m[3]) - 1) // 2))
+    return out
+
+def import_times(code: str) -> list[ImportTime]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+def measure(day: int) -> StartupReport:
+    """ Imports done by `python -m aoc2023 -d <day>` on top of a bare interpreter """
+    interpreter = {i.module for i in import_times("pass")}
+    imports = import_times(f"import aoc2023.__main__, aoc2023.day{day}")
+    return StartupReport([i for i in imports if i.module not in interpreter])
+
+def build_zipapp(target: str, interpreter: str = "/usr/bin/env python3") -> str:
+    """
+    Single file aoc2023.pyz with every module precompiled, runnable as
+    `./aoc2023.pyz -d 9`. The .pyc files are only valid for the Python
+    version that built the archive.
+    """
+    package = path.dirname(path.abspath(__file__))
+    os.makedirs(path.dirname(path.abspath(target)), exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as tmp, open(target, "wb") as out:
+        out.write(f"#!{interpreter}\n".encode())
+        with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as z:
+            z.writestr("__main__.py", "from aoc2023.__main__ import main\nmain()\n")
+            for root, dirs, files in os.walk(package):
+                dirs[:] = [d for d in dirs if d != "__pycache__"]
+                for f in sorted(files):
+                    if not f.endswith(".py"):
+                        continue
+                    source = path.join(root, f)
+                    name = path.join("aoc2023", path.relpath(source, package))
+                    z.write(source, name)
+                    # zipimport only looks for the .pyc right next to the .py
+                    compiled = py_compile.compile(
+                        source,
+                        cfile=path.join(tmp, "module.pyc"),
+                        dfile=name,
+                        doraise=True,
+                        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+                    # only None when it failed without doraise
+                    assert compiled is not None
+                    z.write(compiled, name + "c")
+
+    os.chmod(target, os.stat(target).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return target
+
+@click.command()
+@click.argument("target", default="dist/aoc2023.pyz")
+def zipapp_cli(target: str):
+    """Builds a self-contained aoc2023.pyz"""
+    print(f"Wrote {build_zipapp(target)}")
+
+if __name__ == '__main__':
+    zipapp_cli()
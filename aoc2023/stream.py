@@ -0,0 +1,54 @@
+import contextlib
+import os
+import stat
+import sys
+import time
+from typing import Any, Callable, Iterable
+from aoc2023.runner import DayRun, PartRun
+from aoc2023.solver import Solver, solver_for
+
+# Inputs read once, line by line, so memory stays flat however long they are
+
+def is_stream(filename: str) -> bool:
+    """ - for stdin, or a pipe like /dev/stdin or <(zcat day12.aoc.gz) """
+    if filename == "-":
+        return True
+    try:
+        return stat.S_ISFIFO(os.stat(filename).st_mode)
+    except OSError:
+        return False
+
+def sum_lines(line_parts: dict[int, Callable[[str], int]], lines: Iterable[str]) -> dict[int, int]:
+    totals = {p: 0 for p in line_parts}
+    for line in lines:
+        if line.strip() == "":
+            continue
+        line = line.rstrip("\r\n")
+        for p, line_part in line_parts.items():
+            totals[p] += line_part(line)
+    return totals
+
+def streamer(solver: Solver[Any], part: int = 0) -> Callable[[Iterable[str]], dict[int, Any]] | None:
+    if solver.stream is not None:
+        return solver.stream
+    if solver.line_parts is not None:
+        # only the parts asked for, the others are not worth computing
+        line_parts = {p: f for p, f in solver.line_parts.items() if part in (0, p)}
+        return lambda lines: sum_lines(line_parts, lines)
+    return None
+
+def solve_stream(filename: str, day: int, part: int) -> DayRun:
+    result = DayRun(day)
+    start_time = time.perf_counter()
+    try:
+        solver = solver_for(day)
+        stream = None if solver is None else streamer(solver, part)
+        if solver is None or stream is None:
+            raise NotImplementedError(f"day{day} needs its whole input up front, it can't be streamed")
+        with contextlib.nullcontext(sys.stdin) if filename == "-" else open(filename) as file:
+            answers = stream(file)
+        result.parts = [PartRun(p, f"{answers[p]}") for p in solver.parts(part) if p in answers]
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.total = time.perf_counter() - start_time
+    return result
@@ -1,7 +1,6 @@
 from enum import Enum
 from functools import reduce
 import itertools
-from multiprocessing import Value
 import re
 from typing import Callable
 
@@ -1,36 +1,252 @@
-from dataclasses import dataclass
-from typing import Any, TypeVar
+from array import array
+import contextlib
+import importlib.util
+from dataclasses import dataclass, field
+import io
+from itertools import accumulate, chain, pairwise
+import mmap
+import os
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, NamedTuple, TextIO, TypeVar
 
-@dataclass
-class Pos():
+if TYPE_CHECKING:
+    import numpy
+
+# neighbour offsets, shared instead of built on every adjs call
+ADJS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+ADJS_DIAG = tuple((x, y) for x in (-1, 0, 1) for y in (-1, 0, 1) if (x, y) != (0, 0))
+
+class Pos(NamedTuple):
+    """
+    An immutable (x, y) tuple, so hashing, comparing and ordering are
+    the tuple's own and done in C. Use _replace for a moved copy.
+    """
     x: int
     y: int
 
-    def adjs(self):
-        return [Pos(self.x + x,self.y + y) for (x,y) in [(1, 0), (-1, 0), (0, 1), (0, -1)]]
+    def adjs(self) -> Iterator["Pos"]:
+        x, y = self
+        return (Pos(x + dx, y + dy) for dx, dy in ADJS)
 
-    def adjs_diag(self):
-        ixs = [-1, 0, 1]
-        return [Pos(self.x + x,self.y + y)
-                for x in ixs
-                for y in ixs
-                if (x,y) != (0,0)]
+    def adjs_diag(self) -> Iterator["Pos"]:
+        x, y = self
+        return (Pos(x + dx, y + dy) for dx, dy in ADJS_DIAG)
 
-    def __add__(self, other: Any):
+    def __add__(self, other: Any) -> "Pos":  # type: ignore[override]
         return Pos(self.x + other.x, self.y + other.y)
 
-    def __lt__(self, other:Any) -> bool:
-        return (self.x, self.y) < (other.x, other.y)
-
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
-
     def __str__(self) -> str:
         return f"({self.x}, {self.y})"
 
     def __repr__(self) -> str:
         return self.__str__()
 
+def adjs_within(x: int, y: int, max_x: int, max_y: int,
+                offsets: tuple[tuple[int, int], ...] = ADJS) -> Iterator[tuple[int, int]]:
+    """
+    The neighbours of (x, y) inside 0..max_x, 0..max_y as plain tuples.
+    They equal and hash like the Pos of the same coordinates, so they go
+    in the same sets and dicts without a Pos built for every one.
+    """
+    for dx, dy in offsets:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx <= max_x and 0 <= ny <= max_y:
+            yield nx, ny
+
+
+quiet_mode = False
+
+def set_quiet(quiet: bool):
+    global quiet_mode
+    quiet_mode = quiet
+
+def quiet() -> bool:
+    """ True when days should skip rendering and only print their answers """
+    return quiet_mode
+
+@dataclass
+class Span():
+    name: str
+    # perf_counter seconds
+    start: float
+    duration: float
+    pid: int
+    thread: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+# None unless tracing, so spans cost next to nothing otherwise
+trace_spans: list[Span] | None = None
+
+def start_tracing():
+    global trace_spans
+    trace_spans = []
+
+def stop_tracing() -> list[Span]:
+    global trace_spans
+    spans, trace_spans = trace_spans or [], None
+    return spans
+
+@contextlib.contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    """
+    Records a named span while tracing, spans inside it nest under it.
+    Works both as `with span("parse"):` and as `@span("flood-fill")`.
+    """
+    if trace_spans is None:
+        yield
+        return
+    spans = trace_spans
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans.append(Span(name, start, time.perf_counter() - start, os.getpid(), threading.get_ident(), args))
+
+def chrome_trace(spans: list[Span]) -> dict[str, Any]:
+    """ Trace event format, opens in chrome://tracing, Perfetto and speedscope """
+    return {
+        "displayTimeUnit": "ms",
+        "traceEvents": [{
+            "name": s.name, "ph": "X",
+            "ts": s.start * 1e6, "dur": s.duration * 1e6,
+            "pid": s.pid, "tid": s.thread, "args": s.args}
+            for s in sorted(spans, key=lambda s: s.start)]}
+
+class MappedInput():
+    """
+    Puzzle input as bytes, memory mapped when it comes from a real file.
+    Lines are handed out as memoryview slices of the mapping, so nothing
+    is decoded or copied until a day asks for it. The views are only
+    valid until the input is closed.
+    """
+    def __init__(self, data: bytes | mmap.mmap, file: BinaryIO | None = None):
+        self.file = file
+        self.data = data
+        self.view = memoryview(data)
+
+    @staticmethod
+    def open(filename: str) -> "MappedInput":
+        file = open(filename, "rb")
+        try:
+            return MappedInput(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), file)
+        except ValueError:
+            # empty files can't be mapped
+            return MappedInput(file.read(), file)
+
+    @staticmethod
+    def of_file(file: TextIO | BinaryIO) -> "MappedInput":
+        """ For the legacy run(file) entry points, which may get StringIO """
+        try:
+            return MappedInput(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            data = file.read()
+            return MappedInput(data.encode() if isinstance(data, str) else data)
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def lines(self) -> Iterator[memoryview]:
+        """ Lazily yields every line without its line break """
+        start, size = 0, len(self.data)
+        while start < size:
+            end = self.data.find(b"\n", start)
+            if end == -1:
+                end = size
+            yield self.view[start:end]
+            start = end + 1
+
+    def text(self) -> str:
+        return str(self.data[:], "utf-8")
+
+    def text_file(self) -> io.TextIOWrapper:
+        """ File like object over the same bytes """
+        return io.TextIOWrapper(io.BytesIO(self.data[:]), encoding="utf-8")
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        if self.file is not None:
+            self.file.close()
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *_: Any):
+        self.close()
+
+# everything but digits, minus signs and line breaks turns into spaces
+NUMERIC = bytes(c if c in b"0123456789-\n" else ord(" ") for c in range(256))
+MINUS_ALONE = re.compile(rb"-(?!\d)")
+
+@dataclass
+class IntRows():
+    """ The integers of every line, the ones of line i are values[offsets[i]:offsets[i + 1]] """
+    values: array
+    offsets: array
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, i: int) -> array:
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def rows(self) -> Iterator[list[int]]:
+        # one list of all values sliced up, not an array and a list per row
+        values = self.values.tolist()
+        for start, end in pairwise(self.offsets):
+            yield values[start:end]
+
+    def to_numpy(self) -> "tuple[numpy.ndarray, numpy.ndarray]":
+        """ values and offsets as int64 arrays sharing the memory, needs numpy installed """
+        import numpy
+        return numpy.frombuffer(self.values, dtype=numpy.int64), numpy.frombuffer(self.offsets, dtype=numpy.int64)
+
+def numeric(text: str | bytes | memoryview | mmap.mmap) -> bytes:
+    """ The text with only the integers left, split by whitespace """
+    data = (text.encode() if isinstance(text, str) else bytes(text)).translate(NUMERIC)
+    if b"-" in data:
+        # 3-4 is 3 and -4, like the regex -?\d+ would have it
+        data = MINUS_ALONE.sub(b" ", data.replace(b"-", b" -"))
+    return data
+
+def ints(text: str | bytes | memoryview | mmap.mmap) -> array:
+    """ Every integer, signed ones included """
+    return array("q", map(int, numeric(text).split()))
+
+def int_rows(text: str | bytes | memoryview | mmap.mmap, numpy_from: int = 256 * 1024) -> IntRows:
+    """
+    ints per line, lines without any included so rows line up with the
+    text. Inputs of numpy_from bytes and up are parsed by numpy when it
+    is installed, smaller ones aren't worth its import.
+    """
+    data = numeric(text)
+    if uses_numpy(len(data), numpy_from):
+        return numpy_int_rows(data)
+    rows = list(map(bytes.split, data.splitlines()))
+    return IntRows(
+        array("q", map(int, chain.from_iterable(rows))),
+        array("q", accumulate(map(len, rows), initial=0)))
+
+def uses_numpy(size: int, numpy_from: int = 256 * 1024) -> bool:
+    """ Whether int_rows parses size bytes with numpy """
+    return size >= numpy_from and importlib.util.find_spec("numpy") is not None
+
+def numpy_int_rows(data: bytes) -> IntRows:
+    import numpy
+    chars = numpy.frombuffer(data, dtype=numpy.uint8)
+    # a token starts at every digit or minus sign not right after another one
+    in_token = (chars != ord(" ")) & (chars != ord("\n"))
+    starts = numpy.flatnonzero(in_token & ~numpy.concatenate(([False], in_token[:-1])))
+    # fromstring reads a 0 out of a text without any numbers
+    values = numpy.fromstring(data, dtype=numpy.int64, sep=" ") if len(starts) > 0 else numpy.zeros(0, numpy.int64)
+    line_ends = numpy.flatnonzero(chars == ord("\n"))
+    if len(data) > 0 and data[-1:] != b"\n":
+        line_ends = numpy.append(line_ends, len(data))
+    offsets = numpy.concatenate(([0], numpy.searchsorted(starts, line_ends))).astype(numpy.int64)
+    return IntRows(array("q", values.tobytes()), array("q", offsets.tobytes()))
 
 T = TypeVar("T")
 def filter_empty(l: list[T | None]) -> list[T]:
@@ -0,0 +1,71 @@
+import importlib
+from importlib import resources
+from os import path
+import sys
+import time
+import traceback
+from aoc2023 import utils
+from aoc2023.cache import source_files
+from aoc2023.runner import RunOptions, run_dynamic
+
+def module_name(source_file: str) -> str:
+    """ utils.py -> aoc2023.utils, gen/__init__.py -> aoc2023.gen """
+    name = source_file.removesuffix(".py").removesuffix("/__init__").replace("/", ".")
+    return f"aoc2023.{name}"
+
+def watched_files(filename: str, day: int) -> dict[str, str]:
+    """ path to module name, the data file maps to "" """
+    files = {str(resources.files("aoc2023").joinpath(f)): module_name(f) for f in source_files(day)}
+    files[filename] = ""
+    return files
+
+def mtimes(files: dict[str, str]) -> dict[str, float]:
+    return {f: path.getmtime(f) if path.exists(f) else 0.0 for f in files}
+
+def reload_changed(changed: list[str], day: int):
+    """
+    Helpers are reloaded before the day so that it picks them up again,
+    the day module registers its solver again when it is reloaded
+    """
+    day_module = f"aoc2023.day{day}"
+    helpers = [m for m in changed if m not in ("", day_module)]
+    todo = helpers + ([day_module] if len(helpers) > 0 or day_module in changed else [])
+    for name in todo:
+        module = sys.modules.get(name)
+        if module is None:
+            importlib.import_module(name)
+        else:
+            importlib.reload(module)
+
+def watch(filename: str, day: int, part: int, options: RunOptions, interval: float = 0.2):
+    utils.set_quiet(options.quiet)
+    run_dynamic(filename, day, part, options)
+
+    files = watched_files(filename, day)
+    seen = mtimes(files)
+    print(f"\nWatching {filename} and {len(files) - 1} source files, ctrl-c to stop")
+    try:
+        while True:
+            time.sleep(interval)
+            now = mtimes(files)
+            changed = [f for f in files if now[f] != seen[f]]
+            if len(changed) == 0:
+                continue
+            seen = now
+
+            start = time.perf_counter()
+            print(f"\n--- {', '.join(path.basename(f) for f in changed)} changed ---")
+            try:
+                reload_changed([files[f] for f in changed], day)
+            except Exception:
+                traceback.print_exc()
+                continue
+            utils.set_quiet(options.quiet)
+            run_dynamic(filename, day, part, options)
+            print(f"--- {time.perf_counter() - start:.3f} seconds from change to answer ---")
+
+            # a day might have started importing another helper
+            files = watched_files(filename, day)
+            seen = mtimes(files)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,38 @@
+from os import path
+import tempfile
+from unittest import TestCase
+from aoc2023 import batch
+from aoc2023.runner import RunOptions
+
+class TestParseDays(TestCase):
+    def test_range(self):
+        self.assertEqual(
+            list(range(1, 14)),
+            batch.parse_days("1-13"),
+            "Can parse a range of days")
+
+    def test_mixed(self):
+        self.assertEqual(
+            [1, 3, 5, 6, 7],
+            batch.parse_days("7,1,3,5-6"),
+            "Can parse single days and ranges")
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(ValueError):
+            batch.parse_days("24-26")
+
+class TestRunInputs(TestCase):
+    def test_every_input_solved(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            inputs = {path.join(tmp, "a.aoc"): "0 3 6 9 12 15\n", path.join(tmp, "b.aoc"): "1 3 6 10 15 21\n"}
+            for filename, content in inputs.items():
+                with open(filename, "w") as f: f.write(content)
+
+            solved = {
+                filename: [p.answer for p in r.parts]
+                for filename, r in batch.run_inputs(list(inputs), 9, 0, options=RunOptions(cache="off"))}
+
+        self.assertEqual(
+            {path.join(tmp, "a.aoc"): ["18", "-3"], path.join(tmp, "b.aoc"): ["28", "0"]},
+            solved,
+            "Every input gets its own answers")
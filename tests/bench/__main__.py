@@ -0,0 +1,78 @@
+import random
+import sys
+import time
+from typing import Any, Callable
+import click
+from aoc2023 import utils
+from aoc2023.bench import BenchHistory, git_commit
+from tests.bench.fit import Fit, fit, worse
+from tests.bench.kernels import Kernel, kernels
+
+def per_call(fn: Callable[[], Any], min_time: float = 0.01, repeat: int = 5) -> float:
+    """ seconds per call, the best of repeat rounds of at least min_time each """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+def measure(kernel: Kernel, seed: int) -> tuple[list[float], Fit]:
+    rng = random.Random(seed)
+    seconds = []
+    for n in kernel.sizes:
+        data = kernel.make(n, rng)
+        seconds.append(per_call(lambda: kernel.run(data)))
+    return seconds, fit(kernel.sizes, seconds)
+
+@click.command()
+@click.argument("names", nargs=-1)
+@click.option("--seed", default=2023, help="Random seed for the inputs")
+@click.option("--no-save", is_flag=True, default=False, help="Don't record the fitted classes in the benchmark history")
+def cli(names: tuple[str, ...], seed: int, no_save: bool):
+    """
+    Times the hot kernels over growing sizes and fits their complexity,
+    failing when a class is worse than at the previously benchmarked
+    commit. NAMES picks kernels by prefix, e.g. day7 or day12.all_sols
+    """
+    utils.set_quiet(True)
+    selected = [k for k in kernels if len(names) == 0 or any(k.name.startswith(n) for n in names)]
+    commit = git_commit()
+    history = BenchHistory()
+
+    regressions = 0
+    for kernel in selected:
+        seconds, fitted = measure(kernel, seed)
+        previous = history.complexity_baseline(kernel.name, commit)
+        if previous is not None and worse(previous, fitted.name):
+            # neighbouring classes are close, only a second measurement agreeing counts
+            again = measure(kernel, seed + 1)
+            if not worse(again[1].name, fitted.name):
+                seconds, fitted = again
+        regressed = previous is not None and worse(previous, fitted.name)
+        regressions += regressed
+        timings = " ".join(f"{n}:{1e6 * t:.1f}" for n, t in zip(kernel.sizes, seconds))
+        print(f"{kernel.name:<28} {fitted.name:<12} n^{fitted.exponent:.2f}"
+              + ("" if previous is None else f"  was {previous}")
+              + (" REGRESSION" if regressed else ""))
+        print(f"    µs per call by n  {timings}")
+        if not no_save:
+            history.add_complexity(kernel.name, fitted.name, fitted.exponent, commit)
+    history.close()
+
+    if regressions > 0:
+        print(f"{regressions} kernel(s) got a worse complexity class than at the previous commit")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    cli()
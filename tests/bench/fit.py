@@ -0,0 +1,83 @@
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+@dataclass(frozen=True)
+class Model():
+    name: str
+    f: Callable[[float], float]
+
+# From best to worst, a class further down the list is a regression
+models = [
+    Model("constant", lambda n: 1.0),
+    Model("linear", lambda n: n),
+    Model("n log n", lambda n: n * math.log(n)),
+    Model("quadratic", lambda n: n * n),
+]
+exponential = "exponential"
+classes = [m.name for m in models] + [exponential]
+
+@dataclass
+class Fit():
+    name: str
+    # mean squared relative error of the fit
+    error: float
+    # slope of log t over log n, 1 for linear, 2 for quadratic
+    exponent: float
+
+def slope(xs: list[float], ys: list[float]) -> tuple[float, float]:
+    """ least squares slope and intercept """
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    k = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+    return k, my - k * mx
+
+def relative_error(predicted: list[float], seconds: list[float]) -> float:
+    return sum(((p - t) / t) ** 2 for p, t in zip(predicted, seconds)) / len(seconds)
+
+def overhead_fit(fs: list[float], seconds: list[float]) -> tuple[float, float]:
+    """
+    a and b of t = a + b f(n), minimizing the relative error. a is the
+    call overhead and neither can be negative.
+    """
+    # weighted by 1 / t², in terms of u = 1 / t and v = f / t
+    us = [1 / t for t in seconds]
+    vs = [f / t for f, t in zip(fs, seconds)]
+    suu, svv, suv = sum(u * u for u in us), sum(v * v for v in vs), sum(u * v for u, v in zip(us, vs))
+    su, sv = sum(us), sum(vs)
+    det = suu * svv - suv * suv
+    if det > 0:
+        a, b = (su * svv - sv * suv) / det, (sv * suu - su * suv) / det
+        if a >= 0 and b >= 0:
+            return a, b
+    # on the edge, either no overhead or no growth
+    without_overhead, without_growth = (0.0, sv / svv), (su / suu, 0.0)
+    error = lambda ab: relative_error([ab[0] + ab[1] * f for f in fs], seconds)
+    return min(without_overhead, without_growth, key=error)
+
+def fit(sizes: list[int], seconds: list[float], tolerance: float = 0.01) -> Fit:
+    """
+    Fits every model to the timings and picks the best class, where a
+    model within tolerance of the best error wins if it grows slower.
+    """
+    if len(sizes) < 3 or min(sizes) < 2:
+        raise ValueError(f"Need at least 3 sizes of 2 or more to fit, got {sizes}")
+
+    errors: dict[str, float] = {}
+    for m in models:
+        fs = [m.f(n) for n in sizes]
+        a, b = overhead_fit(fs, seconds)
+        errors[m.name] = relative_error([a + b * f for f in fs], seconds)
+
+    # t = e^(c + k n), only when it grows at all
+    k, c = slope([float(n) for n in sizes], [math.log(t) for t in seconds])
+    if k > 0:
+        errors[exponential] = relative_error([math.exp(c + k * n) for n in sizes], seconds)
+
+    best = min(errors.values())
+    name = next(name for name in classes if name in errors and errors[name] <= best + tolerance)
+    exponent, _ = slope([math.log(n) for n in sizes], [math.log(t) for t in seconds])
+    return Fit(name, errors[name], exponent)
+
+def worse(previous: str, current: str) -> bool:
+    return classes.index(current) > classes.index(previous)
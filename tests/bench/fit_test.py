@@ -0,0 +1,24 @@
+import math
+from unittest import TestCase
+from tests.bench.fit import fit, worse
+
+class TestFit(TestCase):
+    sizes = [100 * 2**i for i in range(6)]
+
+    def fitted(self, t) -> str:
+        return fit(self.sizes, [t(n) for n in self.sizes]).name
+
+    def test_classes(self):
+        self.assertEqual("constant", self.fitted(lambda n: 1e-6))
+        self.assertEqual("linear", self.fitted(lambda n: 1e-6 * n))
+        self.assertEqual("linear", self.fitted(lambda n: 1e-3 + 1e-6 * n), "Call overhead is not growth")
+        self.assertEqual("n log n", self.fitted(lambda n: 1e-6 * n * math.log(n)))
+        self.assertEqual("quadratic", self.fitted(lambda n: 1e-9 * n * n))
+
+    def test_exponential(self):
+        sizes = list(range(4, 12))
+        self.assertEqual("exponential", fit(sizes, [1e-6 * 2**n for n in sizes]).name)
+
+    def test_worse(self):
+        self.assertTrue(worse("linear", "quadratic"))
+        self.assertFalse(worse("n log n", "linear"))
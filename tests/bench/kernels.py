@@ -0,0 +1,112 @@
+import random
+from dataclasses import dataclass
+from typing import Any, Callable
+from aoc2023 import day1, day3, day4, day5, day7, day9, day11, day12, day13
+from aoc2023.utils import Pos
+
+# The hot kernels of the days, each with an input of size n to call it on
+
+@dataclass(frozen=True)
+class Kernel():
+    name: str
+    sizes: list[int]
+    # builds the input of size n, not timed
+    make: Callable[[int, random.Random], Any]
+    run: Callable[[Any], Any]
+
+def doubling(start: int, count: int = 6) -> list[int]:
+    return [start * 2**i for i in range(count)]
+
+def day1_line(n: int, rng: random.Random) -> str:
+    # no digits or digit words before the very end, so every find scans it all
+    return "".join(rng.choice("abcdkmpqz") for _ in range(n)) + "7"
+
+def day3_row(n: int, rng: random.Random) -> tuple[list[str], int, int]:
+    digits = "".join(rng.choice("123456789") for _ in range(n))
+    return ["." * (n + 2), f".{digits}.", "." * (n + 2)], n // 2 + 1, 1
+
+def day4_numbers(n: int, rng: random.Random) -> tuple[list[int], list[int]]:
+    # no winners, so every ticket number is looked for in all of winning
+    numbers = rng.sample(range(100 * n), 2 * n)
+    return numbers[:n], numbers[n:]
+
+def day5_map(n: int, rng: random.Random) -> day5.MapTransform:
+    transforms = [day5.Transform(dest=rng.randrange(10**9), source=100 * i, span=50) for i in range(n)]
+    return day5.MapTransform("seed", "soil", transforms)
+
+def day4_cards(n: int, rng: random.Random) -> list[day4.Card]:
+    # no card wins copies past the last one
+    return [
+        day4.Card(i + 1, list(range(prize)), list(range(10)))
+        for i, prize in enumerate(rng.randrange(min(10, n - i)) for i in range(n))]
+
+def day7_hands(n: int, rng: random.Random) -> list[tuple[str, int]]:
+    return [("".join(rng.choice("AKQJT98765432") for _ in range(5)), rng.randrange(1, 1000)) for _ in range(n)]
+
+def day7_jokers(n: int, rng: random.Random) -> str:
+    # two other cards for every joker to be, 2^n hands to try
+    return "J" * n + "KQ"
+
+def day9_series(n: int, rng: random.Random) -> list[int]:
+    # a degree 5 polynomial like the real inputs, so it ends in zeros
+    coefficients = [rng.randrange(-9, 10) for _ in range(6)]
+    return [sum(c * x**i for i, c in enumerate(coefficients)) for x in range(n)]
+
+def day11_galaxies(n: int, rng: random.Random) -> set[Pos]:
+    return {Pos(rng.randrange(10 * n), rng.randrange(10 * n)) for _ in range(n)}
+
+def day11_space(n: int, rng: random.Random) -> day11.Grid:
+    # n galaxies in n columns and rows, about a third of them empty
+    galaxies = {Pos(rng.randrange(n), rng.randrange(n)) for _ in range(n)}
+    return day11.Grid(
+        Pos(n - 1, n - 1), galaxies,
+        {x: all(p.x != x for p in galaxies) for x in range(n)},
+        {y: all(p.y != y for p in galaxies) for y in range(n)})
+
+def day12_row(n: int, rng: random.Random) -> tuple[str, list[int]]:
+    return "?" * n, [3, 1, 2]
+
+def day12_all_sols(row: tuple[str, list[int]]) -> int:
+    day12.memo.clear()
+    return day12.all_sols(*row)
+
+def day13_grid(n: int, rng: random.Random) -> day13.MirroredGrid:
+    return day13.MirroredGrid({
+        Pos(x, y): rng.choice([day13.O.Rock, day13.O.Ash])
+        for x in range(n) for y in range(n)})
+
+kernels = [
+    Kernel("day1.find_first", doubling(25_000),
+           day1_line, lambda s: day1.find_first(s, [(f"{n}", n) for n in range(1, 10)])),
+    Kernel("day3.determine_value", doubling(64),
+           day3_row, lambda row: day3.determine_value(*row)),
+    Kernel("day4.Card.__init__", doubling(32),
+           day4_numbers, lambda numbers: day4.Card(1, *numbers)),
+    Kernel("day4.count_tickets", doubling(1000),
+           day4_cards, day4.count_tickets),
+    Kernel("day5.MapTransform.lookup", doubling(100),
+           day5_map, lambda m: m.lookup(-1)),
+    Kernel("day7.hand_type", doubling(1000),
+           lambda n, rng: "".join(rng.choice("AKQJT98765432") for _ in range(n)), day7.hand_type),
+    # the reference engines of tests/differential_test.py, next to the ones replacing them
+    Kernel("day7.with_substitutions", list(range(4, 12)),
+           day7_jokers, day7.with_substitutions),
+    Kernel("day7.joker_type", doubling(1000),
+           lambda n, rng: "".join(rng.choice("AKQJT98765432") for _ in range(n)), day7.joker_type),
+    Kernel("day7.ranked_winnings", doubling(500),
+           day7_hands, lambda hands: day7.ranked_winnings(hands, jokers=True)),
+    Kernel("day9.get_next_step", doubling(100),
+           day9_series, day9.get_next_step),
+    Kernel("day9.next_value", doubling(100),
+           day9_series, day9.next_value),
+    Kernel("day11.all_distances", doubling(25),
+           day11_galaxies, day11.all_distances),
+    Kernel("day11.sum_distances", doubling(250),
+           day11_space, lambda grid: day11.sum_distances(grid, 1000000)),
+    Kernel("day12.all_sols", doubling(12, 5),
+           day12_row, day12_all_sols),
+    Kernel("day12.count_arrangements", doubling(100),
+           day12_row, lambda row: day12.count_arrangements(*row)),
+    Kernel("day13.MirroredGrid.mirrors", doubling(16),
+           day13_grid, lambda grid: grid.mirrors()),
+]
@@ -0,0 +1,54 @@
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+from aoc2023.utils import ADJS_DIAG, Pos, adjs_within
+
+# utils.Pos against the mutable dataclass it replaced: python -m tests.bench.pos
+
+@dataclass
+class DataclassPos():
+    x: int
+    y: int
+
+    def adjs_diag(self):
+        ixs = [-1, 0, 1]
+        return [DataclassPos(self.x + x, self.y + y)
+                for x in ixs
+                for y in ixs
+                if (x, y) != (0, 0)]
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+def bytes_per_object(make: Callable[[int, int], Any], n: int = 100_000) -> float:
+    # the coordinates are small ints, which are shared and not counted
+    tracemalloc.start()
+    objects = [make(i % 200, i % 100) for i in range(n)]
+    size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(objects)
+    tracemalloc.stop()
+    return size / n
+
+def ns_per_call(fn: Callable[[], Any], number: int = 200_000) -> float:
+    return 1e9 * min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+def measure(make: Callable[[int, int], Any]) -> dict[str, float]:
+    p = make(10, 20)
+    grid = {make(x, y): x for x in range(100) for y in range(100)}
+    return {
+        "bytes": bytes_per_object(make),
+        "new ns": ns_per_call(lambda: make(10, 20)),
+        "hash ns": ns_per_call(lambda: hash(p)),
+        "lookup ns": ns_per_call(lambda: grid[p]),
+        "adjs_diag ns": ns_per_call(lambda: list(p.adjs_diag()), number=50_000),
+    }
+
+if __name__ == '__main__':
+    before, after = measure(DataclassPos), measure(Pos)
+    print(f"{'':<14}{'dataclass':>12}{'Pos':>12}")
+    for name in before:
+        print(f"{name:<14}{before[name]:>12.1f}{after[name]:>12.1f}  {before[name] / after[name]:.2f}x")
+    # tuples that don't build a Pos per neighbour, against Pos.adjs_diag
+    within = ns_per_call(lambda: list(adjs_within(10, 20, 99, 99, ADJS_DIAG)), number=50_000)
+    print(f"{'adjs_within ns':<14}{'':>12}{within:>12.1f}  {after['adjs_diag ns'] / within:.2f}x")
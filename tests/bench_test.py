@@ -0,0 +1,33 @@
+from os import path
+import tempfile
+from unittest import TestCase
+from aoc2023.bench import BenchHistory, Comparison, PhaseTiming
+
+class TestBench(TestCase):
+    def test_summary(self):
+        timing = PhaseTiming(9, "part1", [0.5, 0.1, 0.2, 0.3, 0.4])
+        self.assertEqual((0.1, 0.3, 0.5), (timing.min(), timing.median(), timing.p95()))
+
+    def test_regression_against_latest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            history = BenchHistory(path.join(tmp, "bench.sqlite"))
+            history.add(PhaseTiming(9, "part1", [1.0]), "abc", "input")
+            history.add(PhaseTiming(9, "part1", [2.0]), "def", "input")
+
+            self.assertEqual(2.0, history.baseline(9, "part1", "input"), "Latest run is the baseline")
+            self.assertEqual(1.0, history.baseline(9, "part1", "input", "abc"))
+            self.assertIsNone(history.baseline(9, "part1", "other input"), "Only the same input is compared")
+
+            self.assertTrue(Comparison(PhaseTiming(9, "part1", [2.5]), 2.0, 0.1).regressed())
+            self.assertFalse(Comparison(PhaseTiming(9, "part1", [2.1]), 2.0, 0.1).regressed())
+            history.close()
+
+    def test_complexity_against_other_commits(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            history = BenchHistory(path.join(tmp, "bench.sqlite"))
+            history.add_complexity("day11.all_distances", "quadratic", 2.0, "abc")
+            history.add_complexity("day11.all_distances", "linear", 1.0, "def")
+
+            self.assertEqual("quadratic", history.complexity_baseline("day11.all_distances", "def"), "The current commit is not its own baseline")
+            self.assertIsNone(history.complexity_baseline("day9.get_next_step", "def"))
+            history.close()
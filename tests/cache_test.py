@@ -0,0 +1,59 @@
+from os import path
+import tempfile
+from unittest import TestCase, mock
+from aoc2023 import cache
+
+class TestSourceFiles(TestCase):
+    def test_follows_local_imports(self):
+        self.assertEqual(
+            ["day10.py", "solver.py", "utils.py"],
+            [path.basename(f) for f in cache.source_files(10)],
+            "Finds the helpers a day imports")
+
+        self.assertIn(
+            "unicode_symbols.py",
+            [path.basename(f) for f in cache.source_files(2)],
+            "Finds helpers imported through the package")
+
+class TestAnswerCache(TestCase):
+    def test_key_changes_with_input(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = path.join(tmp, "day9.aoc")
+            with open(input_file, "w") as f: f.write("1 2 3\n")
+            before = cache.answer_key(input_file, 9, 1)
+            with open(input_file, "w") as f: f.write("1 2 4\n")
+
+            self.assertNotEqual(
+                before,
+                cache.answer_key(input_file, 9, 1),
+                "A changed input invalidates the answer")
+
+    def test_known_digests(self):
+        self.assertEqual(
+            cache.answer_key("data/day9ex.aoc", 9, 2),
+            cache.answer_key("data/day9ex.aoc", 9, 2, cache.digests("data/day9ex.aoc", 9)),
+            "Digests worked out up front give the same key")
+
+    def test_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = cache.AnswerCache(path.join(tmp, "answers.sqlite"))
+            self.assertIsNone(store.get("key"))
+            store.put("key", 9, 1, "114", 0.5)
+
+            self.assertEqual(
+                cache.CachedAnswer("114", 0.5),
+                store.get("key"))
+            self.assertEqual((1, 1, 1), (store.stats().entries, store.stats().hits, store.stats().misses))
+            store.close()
+
+    def test_sources_kept_by_stat(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = cache.AnswerCache(path.join(tmp, "answers.sqlite"))
+            self.assertEqual(cache.sources_digest(10), cache.sources_digest(10, store.scan_source))
+            store.close()
+
+            again = cache.AnswerCache(path.join(tmp, "answers.sqlite"))
+            with mock.patch("aoc2023.cache.scan_source", side_effect=AssertionError("scanned again")):
+                self.assertEqual(cache.sources_digest(10), cache.sources_digest(10, again.scan_source),
+                                 "Unchanged sources come from the db")
+            again.close()
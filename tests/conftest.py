@@ -0,0 +1,8 @@
+from tests import speedups
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if len(speedups.measured) == 0:
+        return
+    terminalreporter.section("differential speedups")
+    for line in speedups.summary(each_case=config.getoption("verbose") > 0):
+        terminalreporter.write_line(line)
@@ -0,0 +1,80 @@
+import io
+from unittest import TestCase
+from hypothesis import given, settings, strategies as st
+from aoc2023 import day4, day7, day9, day11, day12
+from tests.speedups import compare
+
+# The fast engines the solvers use must answer exactly like the code they replaced
+
+@st.composite
+def cards(draw) -> list[day4.Card]:
+    n = draw(st.integers(1, 40))
+    out = []
+    for i in range(n):
+        winning = draw(st.lists(st.integers(1, 99), min_size=1, max_size=10, unique=True))
+        # no card wins copies past the last one
+        wins = draw(st.integers(0, min(len(winning), n - 1 - i)))
+        others = draw(st.lists(st.integers(100, 199), max_size=10, unique=True))
+        out.append(day4.Card(i + 1, winning[:wins] + others, winning))
+    return out
+
+hands = st.lists(st.tuples(st.text("AKQJT98765432", min_size=5, max_size=5), st.integers(1, 1000)), min_size=1, max_size=100)
+
+@st.composite
+def series(draw) -> list[int]:
+    # a polynomial, so the differences end in zeros
+    coefficients = draw(st.lists(st.integers(-10, 10), min_size=1, max_size=8))
+    length = draw(st.integers(len(coefficients) + 1, 21))
+    return [sum(c * x**i for i, c in enumerate(coefficients)) for x in range(length)]
+
+@st.composite
+def space(draw) -> day11.Grid:
+    width, height = draw(st.integers(1, 15)), draw(st.integers(1, 15))
+    galaxies = draw(st.sets(st.tuples(st.integers(0, width - 1), st.integers(0, height - 1)), max_size=30))
+    rows = ["".join("#" if (x, y) in galaxies else "." for x in range(width)) for y in range(height)]
+    return day11.parse_grid(io.StringIO("\n".join(rows) + "\n"))
+
+rows = st.tuples(st.text(".#?", min_size=1, max_size=20), st.lists(st.integers(1, 5), min_size=1, max_size=5))
+
+def all_sols(p: str, rs: list[int]) -> int:
+    day12.memo.clear()
+    return day12.all_sols(p, rs)
+
+class TestDifferential(TestCase):
+    @given(cards())
+    def test_day4_copies(self, cards: list[day4.Card]):
+        expected, actual = compare("day4 total_tickets", lambda: day4.total_tickets(cards), lambda: day4.count_tickets(cards))
+        self.assertEqual(expected, actual)
+
+    @given(hands)
+    def test_day7_winnings(self, hands: list[tuple[str, int]]):
+        expected, actual = compare(
+            "day7 cmp_hands",
+            lambda: day7.total_winnings(hands, day7.cmp_hands), lambda: day7.ranked_winnings(hands))
+        self.assertEqual(expected, actual)
+        expected, actual = compare(
+            "day7 cmp_hands_2",
+            lambda: day7.total_winnings(hands, day7.cmp_hands_2), lambda: day7.ranked_winnings(hands, jokers=True))
+        self.assertEqual(expected, actual, "Jokers")
+
+    @given(series())
+    def test_day9_extrapolation(self, xs: list[int]):
+        expected, actual = compare("day9 get_next_step", lambda: day9.get_next_step(xs), lambda: day9.next_value(xs))
+        self.assertEqual(expected, actual)
+        expected, actual = compare("day9 get_prev_step", lambda: day9.get_prev_step(xs), lambda: day9.prev_value(xs))
+        self.assertEqual(expected, actual, "Backwards")
+
+    @given(space(), st.sampled_from([2, 10, 100, 1000000]))
+    def test_day11_distances(self, grid: day11.Grid, replace_with: int):
+        expected, actual = compare(
+            "day11 all_distances",
+            lambda: day11.all_distances(grid.get_expanded_grid(replace_with)),
+            lambda: day11.sum_distances(grid, replace_with))
+        self.assertEqual(expected, actual)
+
+    @given(rows, st.booleans())
+    @settings(deadline=None)
+    def test_day12_arrangements(self, row: tuple[str, list[int]], unfolded: bool):
+        p, rs = day12.unfold(*row) if unfolded else row
+        expected, actual = compare("day12 all_sols", lambda: all_sols(p, rs), lambda: day12.count_arrangements(p, rs))
+        self.assertEqual(expected, actual, f"{p} {rs}")
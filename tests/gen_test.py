@@ -0,0 +1,20 @@
+from io import StringIO
+from unittest import TestCase
+from aoc2023 import gen
+from aoc2023.solver import solver_for
+
+class TestGen(TestCase):
+    def test_seeded(self):
+        self.assertEqual(gen.generate(8, 1, seed=7), gen.generate(8, 1, seed=7), "Same seed, same input")
+        self.assertNotEqual(gen.generate(8, 1, seed=7), gen.generate(8, 1, seed=8))
+
+    def test_scale(self):
+        small, large = gen.generate(7, 1), gen.generate(7, 10)
+        self.assertEqual(10 * len(small.splitlines()), len(large.splitlines()), "Ten times the hands")
+
+    def test_ghosts_meet(self):
+        solver = solver_for(8)
+        assert solver is not None
+        model = solver.parse(StringIO(gen.generate(8, 1)))
+        self.assertGreater(solver.part1(model), 0, "AAA reaches ZZZ")
+        self.assertGreater(solver.part2(model), 0, "Every ghost reaches a Z")  # type: ignore
@@ -0,0 +1,24 @@
+from os import path
+import tempfile
+from unittest import TestCase
+from aoc2023.incremental import LineStore, solve_lines
+from aoc2023.solver import solver_for
+
+class TestIncremental(TestCase):
+    def test_only_changed_lines(self):
+        solver = solver_for(9)
+        assert solver is not None and solver.line_parts is not None
+        next_step = solver.line_parts[1]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = LineStore(path.join(tmp, "lines.sqlite"))
+            input_file = path.join(tmp, "day9.aoc")
+            with open(input_file, "w") as f: f.write("0 3 6 9 12 15\n1 3 6 10 15 21\n")
+            first = solve_lines(input_file, 9, 1, next_step, store)
+
+            with open(input_file, "a") as f: f.write("10 13 16 21 30 45\n")
+            second = solve_lines(input_file, 9, 1, next_step, store)
+            store.close()
+
+        self.assertEqual((46, 2), (first.total, first.recomputed))
+        self.assertEqual((114, 3, 1), (second.total, second.lines, second.recomputed), "Only the new line is solved")
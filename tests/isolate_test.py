@@ -0,0 +1,27 @@
+from os import path
+import signal
+import tempfile
+from unittest import TestCase
+from aoc2023.isolate import Limits, died, load_limits
+
+class TestLimits(TestCase):
+    def test_per_day_over_defaults(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            limits_file = path.join(tmp, "limits.toml")
+            with open(limits_file, "w") as f:
+                f.write("cpu = 60\nwall = 120\n\n[day12]\nwall = 30\nmemory_mb = 512\n")
+            limits = load_limits(limits_file)
+
+        self.assertEqual(Limits(60, None, 120), limits.for_day(7))
+        self.assertEqual(Limits(60, 512, 30), limits.for_day(12), "Day tables override the defaults")
+
+    def test_died(self):
+        self.assertEqual("timed out (2 s cpu limit)", died(-signal.SIGXCPU, Limits(cpu=2)))
+        self.assertEqual("out of memory (64 MiB limit)", died(-signal.SIGSEGV, Limits(memory_mb=64)))
+        self.assertEqual("crashed with exit code 3", died(3, Limits()))
+
+    def test_killed_with_both_limits(self):
+        limits = Limits(cpu=2, memory_mb=64)
+        self.assertEqual("out of memory (64 MiB limit)", died(-signal.SIGKILL, limits, cpu=0.3))
+        self.assertEqual("timed out (2 s cpu limit)", died(-signal.SIGKILL, limits, cpu=2.5), "Killed at the hard cpu limit")
+        self.assertEqual("timed out (2 s cpu limit)", died(-signal.SIGKILL, Limits(cpu=2)))
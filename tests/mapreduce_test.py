@@ -0,0 +1,13 @@
+from unittest import TestCase
+from aoc2023.mapreduce import line_chunks, solve_chunked
+
+class TestMapReduce(TestCase):
+    def test_chunks_end_at_line_breaks(self):
+        data = b"0 3 6\n1 3 6 10\n\n10 13 16 21 30 45\n7"
+        chunks = line_chunks(data, 4)
+        self.assertEqual(data, b"".join(data[s:e] for s, e in chunks), "Every byte is in a chunk")
+        self.assertTrue(all(data[e - 1:e] == b"\n" for _, e in chunks[:-1]))
+        self.assertEqual([(0, len(data))], line_chunks(data, 1))
+
+    def test_sums_of_chunks(self):
+        self.assertEqual({1: 114, 2: 2}, solve_chunked("data/day9ex.aoc", 9, [1, 2], jobs=2))
@@ -0,0 +1,25 @@
+import gc
+from unittest import TestCase
+from aoc2023.memory import measure_call
+
+class TestMemory(TestCase):
+    def test_measure_call(self):
+        def allocate() -> list[list[int]]:
+            kept = [[i] for i in range(10000)]
+            gc.collect()
+            return kept
+
+        kept, memory = measure_call(allocate, top=1)
+        self.assertEqual(10000, len(kept))
+        self.assertGreaterEqual(memory.traced_peak, 10000 * 56, "Every list is traced")
+        self.assertIn("memory_test.py", memory.top_sites[0].site, "The allocating line is the top site")
+        self.assertGreaterEqual(memory.gc_collections[2], 1, "gc.collect runs a full collection")
+
+    def test_sites_at_peak(self):
+        def allocate_and_free() -> int:
+            temporary = [[i] for i in range(20000)]
+            return len(temporary)
+
+        _, memory = measure_call(allocate_and_free, top=1)
+        self.assertIn("memory_test.py", memory.top_sites[0].site, "Sites are taken at the peak, not after the phase")
+        self.assertGreaterEqual(memory.sites_traced, memory.traced_peak // 2)
@@ -0,0 +1,37 @@
+from dataclasses import replace
+from os import path
+import tempfile
+from unittest import TestCase
+from aoc2023 import models
+from aoc2023.solver import solver_for
+
+class TestModels(TestCase):
+    def test_roundtrip(self):
+        solver = solver_for(7)
+        assert solver is not None
+        with tempfile.TemporaryDirectory() as tmp:
+            model_path = models.model_file(7, "key", tmp)
+            self.assertIsNone(models.load(model_path), "Nothing cached yet")
+
+            model = solver.parse(open("data/day7ex.aoc"))
+            self.assertTrue(models.store(model_path, model))
+            self.assertEqual(model, models.load(model_path), "The parsed hands come back as they were")
+
+            with open(model_path, "r+b") as f:
+                f.seek(len(models.MAGIC))
+                f.write(bytes([models.FORMAT + 1]))
+            self.assertIsNone(models.load(model_path), "Models in another format are dropped")
+
+    def test_unpicklable(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            model_path = path.join(tmp, "day1.model")
+            self.assertFalse(models.store(model_path, (i for i in range(3))), "Generators are not stored")
+            self.assertFalse(path.exists(model_path))
+
+    def test_key_follows_version(self):
+        solver = solver_for(7)
+        assert solver is not None
+        self.assertNotEqual(
+            models.model_key("data/day7ex.aoc", 7, solver),
+            models.model_key("data/day7ex.aoc", 7, replace(solver, version=solver.version + 1)),
+            "Bumping the version drops cached models")
@@ -0,0 +1,32 @@
+import time
+from unittest import TestCase
+from aoc2023 import day11
+from aoc2023.sampling import StackSampler
+from aoc2023.utils import Pos
+
+def spin(seconds: float) -> int:
+    n, end = 0, time.process_time() + seconds
+    while time.process_time() < end:
+        n += 1
+    return n
+
+class TestSampler(TestCase):
+    def test_samples_busy_function(self):
+        sampler = StackSampler(interval=0.001)
+        self.assertGreater(sampler.run(lambda: spin(0.1)), 0)
+
+        self.assertGreater(sum(sampler.stacks.values()), 10, "Samples every millisecond of cpu time")
+        for line in sampler.collapsed().splitlines():
+            stack, _, count = line.rpartition(" ")
+            self.assertIn("sampling_test.spin", stack, "Stacks start at the sampled call")
+            self.assertNotIn("unittest", stack)
+            self.assertTrue(count.isdigit())
+
+    def test_skips_harness_at_root(self):
+        galaxies = {Pos(x, 7 * x % 1000) for x in range(1000)}
+        sampler = StackSampler(interval=0.001, skip=__file__)
+        sampler.run(lambda: day11.all_distances(galaxies))
+
+        self.assertGreater(len(sampler.stacks), 0)
+        for line in sampler.collapsed().splitlines():
+            self.assertTrue(line.startswith("day11.all_distances"), f"{line} starts in the sampled code")
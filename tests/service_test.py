@@ -0,0 +1,22 @@
+import json
+import threading
+from unittest import TestCase
+from urllib.request import urlopen
+from aoc2023 import service
+
+class TestService(TestCase):
+    def test_solve_and_stats(self):
+        server = service.make_server(port=0, jobs=1)
+        port = server.server_address[1]  # type: ignore
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            with urlopen(f"http://127.0.0.1:{port}/solve?day=9", b"0 3 6 9 12 15\n") as response:
+                self.assertEqual({"1": "18", "2": "-3"}, json.load(response)["answers"])
+            with urlopen(f"http://127.0.0.1:{port}/stats") as response:
+                stats = json.load(response)
+            self.assertEqual(0, stats["queue_depth"])
+            self.assertEqual(1, stats["days"]["9"]["requests"], "Requests are counted per day")
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.RequestHandlerClass.pool.terminate()  # type: ignore
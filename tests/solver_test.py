@@ -0,0 +1,23 @@
+from unittest import TestCase
+from aoc2023.solver import solver_for
+from aoc2023.utils import MappedInput
+
+class TestSolver(TestCase):
+    def test_parse_once_solve_both(self):
+        solver = solver_for(9)
+        assert solver is not None
+        model = solver.parse(MappedInput(b"0 3 6 9 12 15\n1 3 6 10 15 21\n10 13 16 21 30 45\n"))
+
+        self.assertEqual(
+            [114, 2],
+            [solve(model) for solve in solver.parts().values()],
+            "Both parts are solved from the same model")
+
+    def test_select_part(self):
+        solver = solver_for(5)
+        assert solver is not None
+        self.assertEqual([1], list(solver.parts().keys()), "day5 only has a part 1")
+        self.assertEqual({}, solver.parts(2))
+
+    def test_placeholder_days(self):
+        self.assertIsNone(solver_for(25), "Days without a solver are not registered")
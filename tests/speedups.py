@@ -0,0 +1,29 @@
+import statistics
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+# reference seconds / fast seconds of every case the differential tests ran,
+# printed by conftest.py at the end of the session
+measured: defaultdict[str, list[float]] = defaultdict(list)
+
+def timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def compare(name: str, reference: Callable[[], Any], fast: Callable[[], Any]) -> tuple[Any, Any]:
+    """ Both answers, for the test to assert on, with the speedup recorded """
+    expected, reference_s = timed(reference)
+    actual, fast_s = timed(fast)
+    measured[name].append(reference_s / max(fast_s, 1e-9))
+    return expected, actual
+
+def summary(each_case: bool = False) -> list[str]:
+    out = []
+    for name, speedups in sorted(measured.items()):
+        out.append(f"{name}: {len(speedups)} cases, speedup min {min(speedups):.1f}x"
+                   f" median {statistics.median(speedups):.1f}x max {max(speedups):.1f}x")
+        if each_case:
+            out += [f"    case {i}: {s:.2f}x" for i, s in enumerate(speedups)]
+    return out
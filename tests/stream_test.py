@@ -0,0 +1,25 @@
+import io
+from unittest import TestCase, mock
+from aoc2023 import day4
+from aoc2023.stream import is_stream, solve_stream
+
+class TestStream(TestCase):
+    def test_stdin(self):
+        self.assertTrue(is_stream("-"))
+        self.assertFalse(is_stream("data/day9ex.aoc"))
+        self.assertFalse(is_stream("data/missing.aoc"))
+
+        with open("data/day9ex.aoc") as f, mock.patch("sys.stdin", io.StringIO(f.read())):
+            result = solve_stream("-", 9, 0)
+        self.assertEqual([(1, "114"), (2, "2")], [(r.part, r.answer) for r in result.parts])
+
+    def test_cards_one_by_one(self):
+        with open("data/day4ex.aoc") as f:
+            cards = day4.parse_cards(f)
+            f.seek(0)
+            streamed = day4.stream_cards(f)
+        self.assertEqual({1: day4.final_score(cards), 2: day4.count_tickets(cards)}, streamed)
+
+    def test_whole_input_days(self):
+        result = solve_stream("-", 7, 0)
+        self.assertIn("can't be streamed", result.error or "", "Day 7 sorts all of its hands")
@@ -0,0 +1,77 @@
+import importlib.util
+import io
+from unittest import TestCase, skipIf
+from aoc2023 import utils
+from aoc2023.utils import MappedInput, Pos, adjs_within, int_rows, ints
+
+class TestMappedInput(TestCase):
+    def test_lines(self):
+        with MappedInput.open("data/day9ex.aoc") as mapped:
+            self.assertEqual(
+                [b"0 3 6 9 12 15", b"1 3 6 10 15 21", b"10 13 16 21 30 45"],
+                [line.tobytes() for line in mapped.lines()],
+                "Lines come without their line breaks")
+
+    def test_without_trailing_newline(self):
+        mapped = MappedInput.of_file(io.StringIO("a\n\nb"))
+        self.assertEqual([b"a", b"", b"b"], [line.tobytes() for line in mapped.lines()])
+        mapped.close()
+
+    def test_text_file(self):
+        mapped = MappedInput(b"Time: 7\nDistance: 9\n")
+        self.assertEqual(["Time: 7\n", "Distance: 9\n"], mapped.text_file().readlines())
+        mapped.close()
+
+class TestPos(TestCase):
+    def test_immutable_tuple(self):
+        p = Pos(1, 2)
+        with self.assertRaises(AttributeError):
+            p.x = 3  # type: ignore
+        self.assertEqual(hash((1, 2)), hash(p))
+        self.assertEqual([Pos(0, 5), Pos(1, 2), Pos(1, 3)], sorted([Pos(1, 3), Pos(0, 5), p]))
+        self.assertEqual(Pos(2, 1), p + Pos(1, -1))
+
+    def test_neighbours(self):
+        self.assertEqual({Pos(2, 2), Pos(0, 2), Pos(1, 3), Pos(1, 1)}, set(Pos(1, 2).adjs()))
+        self.assertEqual(8, len(set(Pos(0, 0).adjs_diag())))
+        self.assertNotIn(Pos(0, 0), set(Pos(0, 0).adjs_diag()))
+        self.assertEqual({Pos(1, 0), Pos(0, 1)}, set(adjs_within(0, 0, 1, 1)), "Only neighbours inside the bounds")
+        self.assertEqual(set(Pos(1, 1).adjs_diag()), set(adjs_within(1, 1, 2, 2, utils.ADJS_DIAG)))
+
+class TestIntRows(TestCase):
+    text = "Card 1: 41 48 | 83 -86\n\nseed-to-soil map:\n3-4 --5 -\n"
+
+    def test_rows(self):
+        rows = int_rows(self.text)
+        self.assertEqual([[1, 41, 48, 83, -86], [], [], [3, -4, -5]], list(rows.rows()), "Rows line up with the lines")
+        self.assertEqual([3, -4, -5], rows.row(3).tolist())
+        self.assertEqual([1, 41, 48, 83, -86, 3, -4, -5], ints(self.text).tolist())
+
+    @skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+    def test_numpy_agrees(self):
+        for text in [self.text, "1 2\n3", "", "\n\n-7\n", "abc\n\n", "- x"]:
+            self.assertEqual(int_rows(text), int_rows(text, numpy_from=0), repr(text))
+
+class TestSpans(TestCase):
+    def test_nested_spans(self):
+        @utils.span("inner")
+        def inner() -> int:
+            return 1
+
+        utils.start_tracing()
+        with utils.span("outer", day=10):
+            inner()
+        spans = utils.stop_tracing()
+
+        self.assertEqual(["inner", "outer"], [s.name for s in spans], "Spans are recorded as they end")
+        [inner_span, outer_span] = spans
+        self.assertLessEqual(outer_span.start, inner_span.start)
+        self.assertGreaterEqual(outer_span.duration, inner_span.duration)
+        self.assertEqual(
+            [{"name": "outer", "ph": "X", "args": {"day": 10}}, {"name": "inner", "ph": "X", "args": {}}],
+            [{k: e[k] for k in ["name", "ph", "args"]} for e in utils.chrome_trace(spans)["traceEvents"]])
+
+    def test_not_tracing(self):
+        with utils.span("ignored"):
+            pass
+        self.assertEqual([], utils.stop_tracing(), "Nothing is recorded unless tracing")
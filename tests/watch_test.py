@@ -0,0 +1,12 @@
+from unittest import TestCase
+from aoc2023 import solver, watch
+
+class TestWatch(TestCase):
+    def test_module_name(self):
+        self.assertEqual("aoc2023.utils", watch.module_name("utils.py"))
+        self.assertEqual("aoc2023.gen", watch.module_name("gen/__init__.py"))
+
+    def test_reload_registers_again(self):
+        before = solver.solver_for(9)
+        watch.reload_changed(["aoc2023.day9"], 9)
+        self.assertIsNot(before, solver.solver_for(9), "The reloaded day registers a new solver")